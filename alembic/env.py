@@ -27,6 +27,7 @@ config.set_main_option("sqlalchemy.url", setting.DB_DSN)
 
 # isort: off
 # Set Model Project
+from src.user.private.models.revoked_token import RevokedToken  # noqa
 from src.user.private.models.user import User  # noqa
 
 # isort: on
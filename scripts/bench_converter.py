@@ -0,0 +1,63 @@
+import argparse
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, List
+
+from src.common.repositories.sqlalchemy.converter import ViewConverter
+from src.user import schemas as sc
+from src.user.private.models.user import User
+
+
+def make_users(count: int) -> List[User]:
+    now = datetime.now(timezone.utc)
+    return [
+        User(
+            id=idx,
+            email=f"user{idx}@example.com",
+            first_name="first",
+            middle_name="middle",
+            last_name="last",
+            password="password",
+            created_at=now,
+            updated_at=None,
+        )
+        for idx in range(count)
+    ]
+
+
+def per_row(convert: Callable[[Any], Any], items: List[Any], repeat: int) -> float:
+    timer = timeit.Timer(lambda: [convert(item) for item in items])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(items) * 1e6
+
+
+def main(sizes: List[int], repeat: int) -> int:
+    converter = ViewConverter(sc.UserView)
+    strategies = {
+        "parse_obj(__dict__)": lambda item: sc.UserView.model_validate(
+            dict(item.__dict__),
+        ),
+        "model_validate(from_attributes)": lambda item: sc.UserView.model_validate(
+            item,
+            from_attributes=True,
+        ),
+        "ViewConverter": converter,
+    }
+
+    sys.stdout.write(f"{'rows':>6}  {'strategy':<32}  us/row\n")
+    for size in sizes:
+        users = make_users(size)
+        for name, convert in strategies.items():
+            cost = per_row(convert, users, repeat)
+            sys.stdout.write(f"{size:>6}  {name:<32}  {cost:.2f}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare per-row cost of converting users to UserView",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sys.exit(main(args.sizes, args.repeat))
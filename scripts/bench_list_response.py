@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, List
+
+import httpx
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.app import app
+from src.common.repositories.sqlalchemy.converter import ViewConverter
+from src.common.schemas.response import ResponseList
+from src.common.web.responses import ModelResponse
+from src.user import schemas as sc
+from src.user.auth import Auth
+from src.user.private.models.user import User
+
+UserListResponse = ResponseList[sc.UserView]
+
+
+def make_views(count: int) -> List[sc.UserView]:
+    convert = ViewConverter(sc.UserView)
+    now = datetime.now(timezone.utc)
+    return [
+        convert(
+            User(
+                id=idx,
+                email=f"user{idx}@example.com",
+                first_name="first",
+                middle_name="middle",
+                last_name="last",
+                created_at=now,
+                updated_at=None,
+            ),
+        )
+        for idx in range(count)
+    ]
+
+
+async def render_validated(field: Any, data: List[Any], meta: dict) -> bytes:
+    content = await serialize_response(
+        field=field,
+        response_content=UserListResponse(data=data, meta=meta),
+        exclude_unset=True,
+    )
+    return JSONResponse(content).body
+
+
+def render_trusted(data: List[Any], meta: dict) -> bytes:
+    return ModelResponse(
+        UserListResponse.from_trusted(data, meta),
+        exclude_unset=True,
+    ).body
+
+
+async def bench_render(rows: int, repeat: int) -> None:
+    data = make_views(rows)
+    meta = {"total": rows, "limit": rows, "offset": 0}
+    field = create_response_field(name="response", type_=UserListResponse)
+    await render_validated(field, data, meta)
+    render_trusted(data, meta)
+
+    start = time.process_time()
+    for _ in range(repeat):
+        validated = await render_validated(field, data, meta)
+    validated_ms = (time.process_time() - start) / repeat * 1e3
+
+    start = time.process_time()
+    for _ in range(repeat):
+        trusted = render_trusted(data, meta)
+    trusted_ms = (time.process_time() - start) / repeat * 1e3
+
+    sys.stdout.write(
+        f"render {rows} rows: response_model + jsonable_encoder "
+        f"{validated_ms:.1f} ms, ModelResponse {trusted_ms:.1f} ms, "
+        f"identical={validated == trusted}\n",
+    )
+
+
+async def bench_endpoint(rows: int, repeat: int) -> None:
+    repository = app.container.repositories.user_repository()
+    users = await repository.get_list(sc.UserListFilter(limit=1))
+    if not users:
+        sys.stderr.write("endpoint benchmark needs users in the database\n")
+        return
+
+    token = Auth.create_access_token({"sub": users[0].email})
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for fields in ("", "&fields=id,email"):
+            url = f"/user/?limit={rows}{fields}"
+            for _ in range(3):
+                await client.get(url, headers=headers)
+
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            for _ in range(repeat):
+                response = await client.get(url, headers=headers)
+                response.raise_for_status()
+            cpu_ms = (time.process_time() - cpu) / repeat * 1e3
+            wall_ms = (time.perf_counter() - wall) / repeat * 1e3
+            count = len(response.json()["data"])
+            sys.stdout.write(
+                f"GET {url}: {count} rows, cpu {cpu_ms:.1f} ms, "
+                f"wall {wall_ms:.1f} ms per request\n",
+            )
+
+
+async def main(args: argparse.Namespace) -> int:
+    await bench_render(args.rows, args.repeat)
+    if args.endpoint:
+        await bench_endpoint(args.rows, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare CPU cost of rendering user list responses",
+    )
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument(
+        "--endpoint",
+        action="store_true",
+        help="also time GET /user/ against the configured database",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+
+from src.app import app
+from src.user.exceptions import PasswordHasherOverloadedError
+from src.user.hashing import PasswordHasher
+
+PASSWORD = "password"
+PROBE_URL = "/metrics/cache"
+
+
+async def probe(
+    client: httpx.AsyncClient,
+    latencies: List[float],
+    stop: asyncio.Event,
+    interval: float,
+) -> None:
+    while not stop.is_set():
+        due = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        await client.get(PROBE_URL)
+        latencies.append(time.perf_counter() - due)
+
+
+async def login(verify: Callable[[str, str], Awaitable[bool]], hashed: str) -> str:
+    try:
+        await verify(PASSWORD, hashed)
+    except PasswordHasherOverloadedError:
+        return "503"
+    return "200"
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))] * 1e3
+
+
+async def run(
+    mode: str,
+    hasher: PasswordHasher,
+    logins: int,
+    interval: float,
+) -> None:
+    hashed = hasher.context.hash(PASSWORD)
+
+    async def verify_inline(password: str, hashed_password: str) -> bool:
+        return hasher.context.verify(password, hashed_password)
+
+    verify = hasher.verify if mode == "offloaded" else verify_inline
+
+    latencies: List[float] = []
+    stop = asyncio.Event()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        probing = asyncio.create_task(probe(client, latencies, stop, interval))
+        await asyncio.sleep(0.2)
+        start = time.perf_counter()
+        results = await asyncio.gather(*[login(verify, hashed) for _ in range(logins)])
+        burst = time.perf_counter() - start
+        stop.set()
+        await probing
+
+    latencies.sort()
+    codes = {code: results.count(code) for code in sorted(set(results))}
+    sys.stdout.write(
+        f"{mode:<10} logins={logins} codes={codes} burst={burst:.2f}s "
+        f"probes={len(latencies)} p50={percentile(latencies, 0.5):.1f}ms "
+        f"p99={percentile(latencies, 0.99):.1f}ms max={latencies[-1] * 1e3:.1f}ms\n",
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    hasher = PasswordHasher(
+        workers=args.workers,
+        queue_size=args.queue_size,
+        schemes=args.schemes,
+        rounds=args.rounds,
+    )
+    for mode in args.modes:
+        asyncio.run(run(mode, hasher, args.logins, args.interval))
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            f"Measure {PROBE_URL} latency during a burst of password checks, "
+            "run inline on the event loop or through PasswordHasher"
+        ),
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["inline", "offloaded"],
+        default=["inline", "offloaded"],
+    )
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=32)
+    parser.add_argument("--schemes", default="bcrypt")
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--interval", type=float, default=0.005)
+    sys.exit(main(parser.parse_args()))
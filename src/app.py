@@ -1,10 +1,11 @@
 from fastapi import FastAPI
 
+from src.common.web.responses import ModelResponse
 from src.server import Server
 
 
 def create_app() -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(default_response_class=ModelResponse)
     return Server(app).get_app()
 
 
@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timezone
+
+from src.common.exceptions.explain import SequentialScanError
+from src.common.repositories.sqlalchemy.advisor import IndexAdvisor
+from src.common.schemas.filters.cursor import encode_cursor
+from src.containers import Container
+from src.settings import setting
+from src.user import schemas as sc
+
+EMAIL = "user@example.com"
+
+
+async def check_indexes(row_threshold: int) -> int:
+    container = Container()
+    container.config.from_dict(setting.dict())
+    repository = container.repositories.user_repository()
+    advisor = IndexAdvisor(container.db().get_stream_session, row_threshold)
+
+    cursor = encode_cursor([datetime.now(timezone.utc), 1])
+    statements = [
+        *advisor.get_statements(
+            repository,
+            [
+                sc.UserFilter(id=1),
+                sc.UserListFilter(),
+                sc.UserListFilter(email=EMAIL),
+                sc.UserListFilter(after=cursor),
+                sc.UserListFilter(created_at__gte=datetime.now(timezone.utc)),
+            ],
+        ),
+        repository._get_by_email_statement().params(email=EMAIL),
+    ]
+    try:
+        await advisor.check(statements)
+    except SequentialScanError as ex:
+        for scan in ex.scans:
+            sys.stderr.write(
+                f"Seq Scan on {scan['relation']} ({scan['rows']:.0f} rows):\n"
+                f"{scan['statement']}\n\n",
+            )
+        return 1
+    sys.stdout.write(f"Checked {len(statements)} statements, no sequential scans\n")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Fail on sequential scans in repository queries",
+    )
+    parser.add_argument("--threshold", type=int, default=1000)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(check_indexes(args.threshold)))
@@ -0,0 +1,5 @@
+from .memory import MemoryCache
+
+__all__ = [
+    "MemoryCache",
+]
@@ -0,0 +1,18 @@
+from typing import Any
+
+
+class SequentialScanError(Exception):
+    def __init__(self, scans: list[dict[str, Any]]):
+        self.scans = scans
+        super().__init__(
+            "Sequential scans found: "
+            + ", ".join(
+                f"{scan['relation']} ({scan['rows']:.0f} rows)" for scan in scans
+            ),
+        )
+
+
+class TooManyQueriesError(Exception):
+    def __init__(self, statements: list[str], message: str):
+        self.statements = statements
+        super().__init__(message)
@@ -0,0 +1,8 @@
+class FilterError(ValueError):
+    ...
+
+
+class InvalidCursorError(FilterError):
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid cursor {cursor}")
@@ -4,3 +4,12 @@ from fastapi import HTTPException, status
 class HTTPNotFoundException(HTTPException):
     def __init__(self) -> None:
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+
+class HTTPServiceUnavailableException(HTTPException):
+    def __init__(self, retry_after: int = 1) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service temporarily overloaded",
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,9 @@
+from typing import Any
+
+
+class DuplicateRowsError(Exception):
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = rows
+        super().__init__(
+            "Duplicate rows: " + ", ".join(str(row["row"]) for row in rows),
+        )
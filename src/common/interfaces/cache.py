@@ -0,0 +1,24 @@
+import abc
+from typing import Any, Optional
+
+
+class AsyncCacheInterface(abc.ABC):
+    @abc.abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abc.abstractmethod
+    async def delete(self, *keys: str) -> None:
+        ...
+
+    @abc.abstractmethod
+    async def clear(self) -> None:
+        ...
+
+    @abc.abstractmethod
+    def stats(self) -> dict[str, Any]:
+        ...
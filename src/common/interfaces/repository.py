@@ -1,5 +1,5 @@
 import abc
-from typing import Generic, List, Optional, TypeVar
+from typing import AsyncIterator, Generic, List, Optional, Sequence, TypeVar
 
 from pydantic import BaseModel
 
@@ -36,6 +36,22 @@ class AsyncBaseRepositoryInterface(
     ) -> List[ViewModel]:
         ...
 
+    @abc.abstractmethod
+    def iterate(
+        self,
+        filter_: AllFilterModel,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[ViewModel]]:
+        ...
+
+    @abc.abstractmethod
+    async def stream(
+        self,
+        filter_: AllFilterModel,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[ViewModel]:
+        ...
+
     @abc.abstractmethod
     async def create(
         self,
@@ -43,6 +59,23 @@ class AsyncBaseRepositoryInterface(
     ) -> Optional[ViewModel]:
         ...
 
+    @abc.abstractmethod
+    async def create_or_ignore(
+        self,
+        obj_in: CreateModel,
+        conflict_fields: Optional[Sequence[str]] = None,
+    ) -> Optional[ViewModel]:
+        ...
+
+    @abc.abstractmethod
+    async def upsert(
+        self,
+        obj_in: CreateModel,
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+    ) -> Optional[ViewModel]:
+        ...
+
     @abc.abstractmethod
     async def update(
         self,
@@ -54,3 +87,35 @@ class AsyncBaseRepositoryInterface(
     @abc.abstractmethod
     async def delete(self, filter_: FilterModel) -> bool:
         ...
+
+    @abc.abstractmethod
+    async def create_many(
+        self,
+        objs_in: List[CreateModel],
+    ) -> List[ViewModel]:
+        ...
+
+    @abc.abstractmethod
+    async def import_many(
+        self,
+        objs_in: List[CreateModel],
+        conflict_fields: Optional[Sequence[str]] = None,
+    ) -> List[Optional[int]]:
+        ...
+
+    @abc.abstractmethod
+    async def update_many(
+        self,
+        obj_in: UpdateModel,
+        filter_: Optional[AllFilterModel] = None,
+        ids: Optional[List[int]] = None,
+    ) -> List[ViewModel]:
+        ...
+
+    @abc.abstractmethod
+    async def delete_many(
+        self,
+        filter_: Optional[AllFilterModel] = None,
+        ids: Optional[List[int]] = None,
+    ) -> int:
+        ...
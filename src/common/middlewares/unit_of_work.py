@@ -0,0 +1,41 @@
+from typing import List
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.database import set_rollback_only
+
+
+class UnitOfWorkMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        pending: List[Message] = []
+
+        async with scope["app"].container.unit_of_work() as session:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    if message["status"] >= 400:
+                        set_rollback_only(session)
+                    pending.append(message)
+                    return
+                if message["type"] == "http.response.body" and not message.get(
+                    "more_body",
+                ):
+                    pending.append(message)
+                    return
+
+                for held in pending:
+                    await send(held)
+                pending.clear()
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        for message in pending:
+            await send(message)
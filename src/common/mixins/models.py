@@ -6,5 +6,9 @@ class PrimaryKeyMixin:
 
 
 class CreatedUpdatedMixin:
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
     updated_at = Column(DateTime(timezone=True), nullable=True, onupdate=func.now())
@@ -1,9 +1,10 @@
-from typing import Generic, Optional, TypeVar
+from typing import Any, AsyncIterator, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel
 
 from src.common.interfaces.repository import AsyncBaseRepositoryInterface
 from src.common.schemas.filters import Filter, ListFilter
+from src.utils.export import WRITERS, ExportFormat
 
 TypeRepository = TypeVar("TypeRepository", bound=AsyncBaseRepositoryInterface)
 TypeView = TypeVar("TypeView", bound=BaseModel)
@@ -21,6 +22,13 @@ class ServiceRepositoryMixin(Generic[TypeRepository, TypeView]):
     async def repository_objects(self, filter_: ListFilter) -> list[TypeView]:
         return await self.repository.get_list(filter_)
 
+    def repository_iterate(
+        self,
+        filter_: ListFilter,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[TypeView]]:
+        return self.repository.iterate(filter_, batch_size=batch_size)
+
     async def repository_create_object(self, obj_in: BaseModel) -> Optional[TypeView]:
         return await self.repository.create(obj_in)
 
@@ -33,3 +41,49 @@ class ServiceRepositoryMixin(Generic[TypeRepository, TypeView]):
 
     async def repository_delete_object(self, filter_: Filter) -> bool:
         return await self.repository.delete(filter_)
+
+    async def repository_create_objects(
+        self,
+        objs_in: List[BaseModel],
+    ) -> List[TypeView]:
+        return await self.repository.create_many(objs_in)
+
+    async def repository_update_objects(
+        self,
+        obj_in: BaseModel,
+        filter_: Optional[ListFilter] = None,
+        ids: Optional[List[int]] = None,
+    ) -> List[TypeView]:
+        return await self.repository.update_many(obj_in, filter_=filter_, ids=ids)
+
+    async def repository_delete_objects(
+        self,
+        filter_: Optional[ListFilter] = None,
+        ids: Optional[List[int]] = None,
+    ) -> int:
+        return await self.repository.delete_many(filter_=filter_, ids=ids)
+
+    async def repository_export(
+        self,
+        filter_: ListFilter,
+        format_: ExportFormat = ExportFormat.CSV,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        columns = self.export_fields
+        if filter_.selected_fields is not None:
+            columns = {
+                field: name
+                for field, name in columns.items()
+                if field in filter_.selected_fields
+            }
+        filter_.fields = ",".join(columns)
+
+        items = await self.repository.stream(filter_, batch_size)
+        return WRITERS[format_](self._export_rows(items), columns, batch_size)
+
+    @staticmethod
+    async def _export_rows(
+        items: AsyncIterator[TypeView],
+    ) -> AsyncIterator[dict[str, Any]]:
+        async for item in items:
+            yield item.model_dump(mode="json", exclude_unset=True)
@@ -1,7 +1,9 @@
+from .cached import CachedRepositoryMixin
 from .filter_builder import FilterBuilder
 from .repository import SqlAlchemyRepository
 
 __all__ = [
     "SqlAlchemyRepository",
+    "CachedRepositoryMixin",
     "FilterBuilder",
 ]
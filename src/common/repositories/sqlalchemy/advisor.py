@@ -0,0 +1,105 @@
+import json
+from typing import Any, AsyncContextManager, Callable, Iterator, List, Sequence
+
+from sqlalchemy import Select, func, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.exceptions.explain import SequentialScanError
+from src.common.schemas.filters import ListFilter
+from src.common.schemas.filters.base import BaseFilter
+
+from .explain import Explain
+from .repository import SqlAlchemyRepository
+
+RELATION_ROWS_QUERY = text(
+    "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:relation)",
+)
+
+
+def iter_plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from iter_plan_nodes(child)
+
+
+class IndexAdvisor:
+    def __init__(
+        self,
+        session_factory: Callable[..., AsyncContextManager[AsyncSession]],
+        row_threshold: int = 1000,
+        disable_seqscan: bool = True,
+    ):
+        self.session_factory = session_factory
+        self.row_threshold = row_threshold
+        self.disable_seqscan = disable_seqscan
+
+    @staticmethod
+    def get_statements(
+        repository: SqlAlchemyRepository,
+        filters: Sequence[BaseFilter],
+    ) -> Iterator[Select]:
+        for filter_ in filters:
+            columns = repository._get_projection(
+                repository.view_model,
+                filter_.selected_fields,
+            )
+            if isinstance(filter_, ListFilter):
+                yield repository._get_list_statement(
+                    filter_,
+                    repository._get_select(columns, filter_),
+                )
+                yield repository._get_count_statement(filter_)
+            else:
+                yield repository._get_statement(
+                    filter_,
+                    repository._get_select(columns),
+                )
+
+    async def _relation_rows(self, session: AsyncSession, relation: str) -> float:
+        rows = await session.scalar(RELATION_ROWS_QUERY, {"relation": relation})
+        if rows is None or rows < 0:
+            rows = await session.scalar(
+                select(func.count()).select_from(table(relation))
+            )
+        return rows
+
+    async def find_seq_scans(
+        self, statements: Sequence[Select]
+    ) -> List[dict[str, Any]]:
+        scans = []
+        async with self.session_factory() as session:
+            try:
+                if self.disable_seqscan:
+                    await session.execute(text("SET LOCAL enable_seqscan = off"))
+                for stmt in statements:
+                    plan = await session.scalar(Explain(stmt))
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    for node in iter_plan_nodes(plan[0]["Plan"]):
+                        if node["Node Type"] != "Seq Scan":
+                            continue
+                        relation = node["Relation Name"]
+                        rows = await self._relation_rows(session, relation)
+                        if rows >= self.row_threshold:
+                            scans.append(
+                                {
+                                    "relation": relation,
+                                    "rows": rows,
+                                    "statement": str(stmt),
+                                },
+                            )
+            finally:
+                await session.rollback()
+        return scans
+
+    async def check(self, statements: Sequence[Select]) -> None:
+        scans = await self.find_seq_scans(statements)
+        if scans:
+            raise SequentialScanError(scans)
+
+    async def check_repository(
+        self,
+        repository: SqlAlchemyRepository,
+        filters: Sequence[BaseFilter],
+    ) -> None:
+        await self.check(list(self.get_statements(repository, filters)))
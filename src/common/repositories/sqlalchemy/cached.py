@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, ClassVar, List, Optional, Sequence
+from uuid import uuid4
+
+from src.common.interfaces.cache import AsyncCacheInterface
+from src.common.schemas.filters import Filter, ListFilter
+
+
+class CachedRepositoryMixin:
+    cache: Optional[AsyncCacheInterface] = None
+    cache_ttl: Optional[float] = None
+    cache_namespace: Optional[str] = None
+
+    _inflight: ClassVar[dict[str, asyncio.Event]] = {}
+
+    def _cache_key(self, *parts: Any) -> str:
+        namespace = self.cache_namespace or self.model.__tablename__
+        return ":".join([namespace, *map(str, parts)])
+
+    async def _get_generation(self) -> str:
+        key = self._cache_key("generation")
+        generation = await self.cache.get(key)
+        if generation is None:
+            generation = uuid4().hex
+            await self.cache.set(key, generation, self.cache_ttl)
+        return generation
+
+    async def _bump_generation(self) -> None:
+        key = self._cache_key("generation")
+        await self.cache.set(key, uuid4().hex, self.cache_ttl)
+
+    async def _cached(self, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        value = await self.cache.get(key)
+        if value is not None:
+            return value
+
+        event = self._inflight.get(key)
+        if event is not None:
+            await event.wait()
+            value = await self.cache.get(key)
+            if value is not None:
+                return value
+            return await load()
+
+        event = self._inflight[key] = asyncio.Event()
+        try:
+            value = await load()
+            if value is not None:
+                await self.cache.set(key, value, self.cache_ttl)
+            return value
+        finally:
+            del self._inflight[key]
+            event.set()
+
+    @staticmethod
+    def _filter_hash(filter_: ListFilter) -> str:
+        values = filter_.model_dump(mode="json", exclude_none=True)
+        payload = json.dumps([type(filter_).__qualname__, values], sort_keys=True)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def _cache_enabled(self) -> bool:
+        if self.cache is None:
+            return False
+        primary_used = getattr(self, "primary_used", None)
+        return primary_used is None or not primary_used()
+
+    async def get(self, filter_: Filter) -> Any:
+        lookup = filter_.model_dump(exclude_none=True)
+        if not self._cache_enabled() or lookup.keys() != {"id"}:
+            return await super().get(filter_)
+
+        return await self._cached(
+            self._cache_key("get", filter_.id),
+            lambda: super(CachedRepositoryMixin, self).get(filter_),
+        )
+
+    async def get_list(self, filter_: ListFilter) -> List[Any]:
+        if not self._cache_enabled():
+            return await super().get_list(filter_)
+
+        async def load() -> tuple[List[Any], dict[str, Any]]:
+            data = await super(CachedRepositoryMixin, self).get_list(filter_)
+            return data, filter_.meta
+
+        generation = await self._get_generation()
+        key = self._cache_key("list", generation, self._filter_hash(filter_))
+        data, meta = await self._cached(key, load)
+        filter_.set_total(meta["total"])
+        filter_.set_cursors(meta["next_cursor"], meta["prev_cursor"])
+        return data
+
+    async def _invalidate(self, ids: Sequence[Any]) -> None:
+        await super()._invalidate(ids)
+        if self.cache is None:
+            return
+
+        await self._bump_generation()
+        await self.cache.delete(*[self._cache_key("get", id_) for id_ in ids])
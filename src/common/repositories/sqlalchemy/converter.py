@@ -0,0 +1,63 @@
+import operator
+from typing import Any, Iterable, Optional, Type, Union, get_args
+
+from pydantic import BaseModel
+
+_object_setattr = object.__setattr__
+
+
+def _is_nested(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_is_nested(arg) for arg in get_args(annotation))
+
+
+class ViewConverter:
+    def __init__(
+        self,
+        view_model: Type[BaseModel],
+        fields: Optional[Iterable[str]] = None,
+    ):
+        self.view_model = view_model
+        self.names = tuple(
+            name for name in view_model.model_fields if fields is None or name in fields
+        )
+        self.nested = any(
+            _is_nested(view_model.model_fields[name].annotation) for name in self.names
+        )
+        self._fields_set = frozenset(self.names)
+        self._getter = operator.attrgetter(*self.names)
+        self._defaults = {
+            name: field
+            for name, field in view_model.model_fields.items()
+            if name not in self._fields_set and not field.is_required()
+        }
+        self.direct = not (
+            view_model.__pydantic_post_init__
+            or view_model.__pydantic_root_model__
+            or view_model.__private_attributes__
+            or view_model.model_config.get("extra") == "allow"
+        )
+
+    def __call__(self, obj: Any) -> BaseModel:
+        if self.nested:
+            return self.view_model.model_validate(obj, from_attributes=True)
+
+        values: Union[tuple, Any] = self._getter(obj)
+        if len(self.names) == 1:
+            values = (values,)
+        if not self.direct:
+            return self.view_model.model_construct(
+                _fields_set=set(self._fields_set),
+                **dict(zip(self.names, values)),
+            )
+
+        data = dict(zip(self.names, values))
+        for name, field in self._defaults.items():
+            data[name] = field.get_default(call_default_factory=True)
+        model = self.view_model.__new__(self.view_model)
+        _object_setattr(model, "__dict__", data)
+        _object_setattr(model, "__pydantic_fields_set__", set(self._fields_set))
+        _object_setattr(model, "__pydantic_extra__", None)
+        _object_setattr(model, "__pydantic_private__", None)
+        return model
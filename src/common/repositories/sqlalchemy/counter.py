@@ -0,0 +1,66 @@
+from collections import Counter
+from typing import Any, List, Optional
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.common.exceptions.explain import TooManyQueriesError
+
+TRANSACTION_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryCounter:
+    def __init__(
+        self,
+        *engines: Engine | AsyncEngine,
+        limit: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+    ):
+        self.engines = [
+            engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+            for engine in engines
+        ]
+        self.limit = limit
+        self.max_repeats = max_repeats
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self) -> dict[str, int]:
+        return {
+            statement: count
+            for statement, count in Counter(self.statements).items()
+            if count > 1
+        }
+
+    def _before_cursor_execute(self, *args: Any) -> None:
+        if not args[2].lstrip().upper().startswith(TRANSACTION_STATEMENTS):
+            self.statements.append(args[2])
+
+    def check(self) -> None:
+        if self.limit is not None and self.count > self.limit:
+            raise TooManyQueriesError(
+                self.statements,
+                f"Expected at most {self.limit} queries, got {self.count}",
+            )
+        if self.max_repeats is None:
+            return
+        for statement, count in self.repeated().items():
+            if count > self.max_repeats:
+                raise TooManyQueriesError(
+                    self.statements,
+                    f"Possible N+1: {count} executions of {statement}",
+                )
+
+    def __enter__(self) -> "QueryCounter":
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, exc_type: Any, *_: Any) -> None:
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        if exc_type is None:
+            self.check()
@@ -1,22 +1,381 @@
-from typing import Optional
+import operator
+from datetime import date, datetime
+from typing import Any, Callable, Hashable, Optional, Sequence
 
-from sqlalchemy import Select, select
-from sqlalchemy.orm import ColumnProperty, DeclarativeMeta, RelationshipProperty
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    Integer,
+    Select,
+    all_,
+    and_,
+    any_,
+    bindparam,
+    func,
+    inspect,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import (
+    ColumnProperty,
+    DeclarativeMeta,
+    InstrumentedAttribute,
+    RelationshipProperty,
+)
 
+from src.common.exceptions.filters import FilterError, InvalidCursorError
 from src.common.schemas.filters import ListFilter
+from src.common.schemas.filters.base import BaseListFilter
+from src.common.schemas.filters.cursor import decode_cursor, encode_cursor
+
+Ordering = list[tuple[str, InstrumentedAttribute, bool]]
+Lookup = Callable[[InstrumentedAttribute, Any], ColumnElement]
+
+LOOKUPS: dict[str, Lookup] = {
+    "eq": operator.eq,
+    "iexact": lambda column, value: func.lower(column) == func.lower(value),
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda column, value: column == any_(value),
+    "not_in": lambda column, value: column != all_(value),
+    "like": lambda column, value: column.like(value),
+    "ilike": lambda column, value: column.ilike(value),
+    "contains": lambda column, value: column.like(value, escape="/"),
+    "icontains": lambda column, value: column.ilike(value, escape="/"),
+    "startswith": lambda column, value: column.like(value, escape="/"),
+    "istartswith": lambda column, value: column.ilike(value, escape="/"),
+    "isnull": lambda column, value: column.is_(None) if value else column.is_not(None),
+}
+SEQUENCE_LOOKUPS = {"in", "not_in"}
+PATTERN_LOOKUPS = {
+    "contains": "%{}%",
+    "icontains": "%{}%",
+    "startswith": "{}%",
+    "istartswith": "{}%",
+}
+LITERAL_LOOKUPS = {"isnull"}
+
+
+def coerce_value(column: InstrumentedAttribute, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if python_type in (datetime, date) and isinstance(value, str):
+        return python_type.fromisoformat(value)
+    if not isinstance(value, python_type):
+        return python_type(value)
+    return value
+
+
+def escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+class FilterCondition:
+    def __init__(
+        self,
+        name: str,
+        column: InstrumentedAttribute,
+        lookup: str,
+        relations: list[InstrumentedAttribute],
+    ):
+        self.name = name
+        self.column = column
+        self.lookup = lookup
+        self.relations = relations
+        self.param: Optional[BindParameter] = None
+        if lookup not in LITERAL_LOOKUPS:
+            type_ = ARRAY(column.type) if lookup in SEQUENCE_LOOKUPS else column.type
+            self.param = bindparam(f"p_{name}", type_=type_)
+
+    def __call__(self, value: Any) -> ColumnElement:
+        return self.criterion(value).params(self.params(value))
+
+    def criterion(self, value: Any = None) -> ColumnElement:
+        if self.param is None:
+            criterion = LOOKUPS[self.lookup](self.column, bool(value))
+        else:
+            criterion = LOOKUPS[self.lookup](self.column, self.param)
+
+        for relation in reversed(self.relations):
+            if relation.property.uselist:
+                criterion = relation.any(criterion)
+            else:
+                criterion = relation.has(criterion)
+        return criterion
+
+    def shape(self, value: Any) -> Hashable:
+        return bool(value) if self.param is None else None
+
+    def params(self, value: Any) -> dict[str, Any]:
+        if self.param is None:
+            return {}
+        try:
+            return {self.param.key: self._prepare(value)}
+        except (TypeError, ValueError):
+            raise FilterError(f"Invalid value for {self.name}") from None
+
+    def _prepare(self, value: Any) -> Any:
+        if self.lookup in SEQUENCE_LOOKUPS:
+            if isinstance(value, str):
+                value = [item.strip() for item in value.split(",") if item.strip()]
+            return [coerce_value(self.column, item) for item in value]
+        if self.lookup in PATTERN_LOOKUPS:
+            return PATTERN_LOOKUPS[self.lookup].format(escape_like(str(value)))
+        return coerce_value(self.column, value)
 
 
 class FilterBuilder:
     def __init__(self, model: DeclarativeMeta):
         self._model = model
+        self._primary_keys = [column.key for column in inspect(model).primary_key]
+        self._conditions: dict[tuple[type, frozenset[str]], list[FilterCondition]] = {}
 
     def build(self, filter_: ListFilter, stmt: Optional[Select] = None) -> Select:
+        values = self.get_values(filter_)
+        stmt = self.build_template(filter_, stmt, values)
+        return stmt.params(self.get_params(filter_, values))
+
+    def build_template(
+        self,
+        filter_: ListFilter,
+        stmt: Optional[Select] = None,
+        values: Optional[dict[str, Any]] = None,
+    ) -> Select:
+        stmt = self.build_filters_template(filter_, stmt, values)
+        ordering = self.get_ordering(filter_)
+
+        if filter_.after is not None:
+            stmt = stmt.where(self._keyset(ordering, "after", forward=True))
+        if filter_.before is not None:
+            stmt = stmt.where(self._keyset(ordering, "before", forward=False))
+        if not filter_.is_keyset:
+            stmt = stmt.offset(bindparam("p_offset", type_=Integer))
+
+        backward = self._is_backward(filter_)
+        stmt = stmt.order_by(
+            *[
+                column.desc() if descending != backward else column.asc()
+                for _, column, descending in ordering
+            ],
+        )
+
+        return stmt.limit(bindparam("p_limit", type_=Integer))
+
+    def build_filters(
+        self,
+        filter_: ListFilter,
+        stmt: Optional[Select] = None,
+    ) -> Select:
+        values = self.get_values(filter_)
+        stmt = self.build_filters_template(filter_, stmt, values)
+        return stmt.params(self.get_filter_params(filter_, values))
+
+    def build_filters_template(
+        self,
+        filter_: ListFilter,
+        stmt: Optional[Select] = None,
+        values: Optional[dict[str, Any]] = None,
+    ) -> Select:
         if stmt is None:
             stmt = select(self._model)
+        if values is None:
+            values = self.get_values(filter_)
+        return stmt.where(
+            *[
+                condition.criterion(values[condition.name])
+                for condition in self.get_conditions(type(filter_), frozenset(values))
+            ],
+        )
+
+    def get_criteria(self, filter_: ListFilter) -> list[ColumnElement]:
+        values = self.get_values(filter_)
+        return [
+            condition(values[condition.name])
+            for condition in self.get_conditions(type(filter_), frozenset(values))
+        ]
+
+    @staticmethod
+    def get_values(filter_: ListFilter) -> dict[str, Any]:
+        return filter_.model_dump(
+            exclude=set(BaseListFilter.model_fields),
+            exclude_none=True,
+        )
+
+    def template_key(
+        self,
+        filter_: ListFilter,
+        values: Optional[dict[str, Any]] = None,
+    ) -> Hashable:
+        if values is None:
+            values = self.get_values(filter_)
+        conditions = self.get_conditions(type(filter_), frozenset(values))
+        return (
+            type(filter_),
+            tuple(
+                (condition.name, condition.shape(values[condition.name]))
+                for condition in conditions
+            ),
+            filter_.order_by,
+            filter_.after is not None,
+            filter_.before is not None,
+        )
+
+    def get_filter_params(
+        self,
+        filter_: ListFilter,
+        values: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        if values is None:
+            values = self.get_values(filter_)
+        params: dict[str, Any] = {}
+        for condition in self.get_conditions(type(filter_), frozenset(values)):
+            params.update(condition.params(values[condition.name]))
+        return params
+
+    def get_params(
+        self,
+        filter_: ListFilter,
+        values: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        params = self.get_filter_params(filter_, values)
+        ordering = self.get_ordering(filter_)
+        if filter_.after is not None:
+            params.update(self._cursor_params(ordering, "after", filter_.after))
+        if filter_.before is not None:
+            params.update(self._cursor_params(ordering, "before", filter_.before))
+        params["p_offset"] = filter_.offset
+        params["p_limit"] = filter_.limit + 1
+        return params
+
+    def get_conditions(
+        self,
+        filter_class: type,
+        names: frozenset[str],
+    ) -> list[FilterCondition]:
+        key = (filter_class, names)
+        if key not in self._conditions:
+            self._conditions[key] = [self._compile(name) for name in sorted(names)]
+        return self._conditions[key]
+
+    def _compile(self, name: str) -> FilterCondition:
+        path = name.split("__")
+        lookup = "eq"
+        if len(path) > 1 and path[-1] in LOOKUPS:
+            lookup = path.pop()
+
+        column = self.get_model_field_to_filter(path)
+        if not isinstance(column, InstrumentedAttribute) or not isinstance(
+            column.prop,
+            ColumnProperty,
+        ):
+            raise FilterError(f"Unknown filter field {name}")
+
+        relations = []
+        field = self._model
+        for p in path[:-1]:
+            field = getattr(field, p)
+            relations.append(field)
+            field = field.property.mapper.class_
+
+        return FilterCondition(name, column, lookup, relations)
+
+    def apply_cursors(self, filter_: ListFilter, rows: Sequence[Any]) -> list[Any]:
+        has_more = len(rows) > filter_.limit
+        rows = list(rows[: filter_.limit])
+
+        backward = self._is_backward(filter_)
+        if backward:
+            rows.reverse()
+
+        if not rows:
+            filter_.set_cursors(None, None)
+            return rows
+
+        names = [name for name, _, _ in self.get_ordering(filter_)]
+        first = encode_cursor([getattr(rows[0], name) for name in names])
+        last = encode_cursor([getattr(rows[-1], name) for name in names])
+
+        if backward:
+            filter_.set_cursors(last, first if has_more else None)
+        else:
+            has_prev = filter_.after is not None or filter_.offset > 0
+            filter_.set_cursors(last if has_more else None, first if has_prev else None)
+        return rows
+
+    def get_ordering(self, filter_: ListFilter) -> Ordering:
+        ordering: Ordering = []
+        names = filter_.order_by.split(",") if filter_.order_by else filter_.ordering
+        for name in names:
+            descending = name.strip().startswith("-")
+            name = name.strip().lstrip("-")
+            if filter_.order_by and name not in filter_.orderable:
+                raise FilterError(f"Ordering by {name} is not allowed")
+
+            field = self.get_model_field_to_filter([name])
+            if not isinstance(field, InstrumentedAttribute) or not isinstance(
+                field.prop,
+                ColumnProperty,
+            ):
+                raise FilterError(f"Unknown ordering field {name}")
+            ordering.append((name, field, descending))
+
+        names = {name for name, _, _ in ordering}
+        for name in self._primary_keys:
+            if name not in names:
+                ordering.append((name, getattr(self._model, name), False))
+        return ordering
+
+    @staticmethod
+    def _is_backward(filter_: ListFilter) -> bool:
+        return filter_.before is not None and filter_.after is None
+
+    def _keyset(self, ordering: Ordering, prefix: str, forward: bool) -> ColumnElement:
+        columns = [column for _, column, _ in ordering]
+        values = [
+            bindparam(f"p_{prefix}_{idx}", type_=column.type)
+            for idx, column in enumerate(columns)
+        ]
+
+        directions = {descending for _, _, descending in ordering}
+        if len(directions) == 1:
+            greater = forward != directions.pop()
+            left, right = tuple_(*columns), tuple_(*values)
+            return left > right if greater else left < right
+
+        criteria = []
+        for idx, (_, column, descending) in enumerate(ordering):
+            greater = forward != descending
+            criteria.append(
+                and_(
+                    *[columns[i] == values[i] for i in range(idx)],
+                    column > values[idx] if greater else column < values[idx],
+                ),
+            )
+        return or_(*criteria)
 
-        stmt = stmt.limit(filter_.limit).offset(filter_.offset)
+    @staticmethod
+    def _cursor_params(ordering: Ordering, prefix: str, cursor: str) -> dict[str, Any]:
+        values = decode_cursor(cursor)
+        if len(values) != len(ordering):
+            raise InvalidCursorError(cursor)
 
-        return stmt
+        try:
+            return {
+                f"p_{prefix}_{idx}": coerce_value(column, value)
+                for idx, ((_, column, _), value) in enumerate(zip(ordering, values))
+            }
+        except (TypeError, ValueError):
+            raise InvalidCursorError(cursor) from None
 
     def get_model_field_to_filter(
         self,
@@ -30,10 +389,12 @@ class FilterBuilder:
                     field = getattr(field, p)
                 else:
                     return None
-            elif isinstance(field.prop, RelationshipProperty):
+            elif isinstance(getattr(field, "prop", None), RelationshipProperty):
                 if hasattr(field.property.mapper.class_, p):
                     field = getattr(field.property.mapper.class_, p)
                 else:
                     return None
+            else:
+                return None
 
         return field
@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, List, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+from src.utils.tasks import spawn_detached
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_loaders: WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    dict[Hashable, "BatchLoader"],
+] = WeakKeyDictionary()
+
+
+class BatchLoader(Generic[K, V]):
+    def __init__(
+        self,
+        load_many: Callable[[List[K]], Awaitable[dict[K, V]]],
+        max_batch_size: int = 1000,
+        name: Optional[str] = None,
+    ):
+        self.load_many = load_many
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self.loads = 0
+        self.batches = 0
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: List[K] = []
+
+    async def load(self, key: K) -> Optional[V]:
+        self.loads += 1
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            future = self._futures[key] = loop.create_future()
+            self._queue.append(key)
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        for idx in range(0, len(queue), self.max_batch_size):
+            spawn_detached(self._resolve(queue[idx : idx + self.max_batch_size]))
+
+    async def _resolve(self, keys: List[K]) -> None:
+        self.batches += 1
+        try:
+            values = await self.load_many(keys)
+        except Exception as ex:
+            for key in keys:
+                self._futures.pop(key).set_exception(ex)
+            return
+
+        for key in keys:
+            self._futures.pop(key).set_result(values.get(key))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "loads": self.loads,
+            "batches": self.batches,
+            "pending": len(self._futures),
+        }
+
+
+def get_loader(
+    key: Hashable,
+    load_many: Callable[[List[Any]], Awaitable[dict[Any, Any]]],
+    max_batch_size: int = 1000,
+    name: Optional[str] = None,
+) -> BatchLoader:
+    loaders = _loaders.setdefault(asyncio.get_running_loop(), {})
+    if key not in loaders:
+        loaders[key] = BatchLoader(load_many, max_batch_size, name or str(key))
+    return loaders[key]
+
+
+def loader_stats() -> dict[str, dict[str, Any]]:
+    try:
+        loaders = _loaders.get(asyncio.get_running_loop(), {})
+    except RuntimeError:
+        return {}
+
+    stats: dict[str, dict[str, Any]] = {}
+    for loader in loaders.values():
+        totals = stats.setdefault(loader.name, {})
+        for name, value in loader.stats().items():
+            totals[name] = totals.get(name, 0) + value
+    return stats
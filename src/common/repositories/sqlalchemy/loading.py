@@ -0,0 +1,78 @@
+from enum import Enum
+from typing import Any, Callable, Iterable, List, Optional, Type, get_args
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import DeclarativeMeta, joinedload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+
+class LoadingStrategy(str, Enum):
+    SELECTIN = "selectin"
+    JOINED = "joined"
+    RAISE = "raise"
+
+
+LOADERS: dict[LoadingStrategy, Callable[[Any], Any]] = {
+    LoadingStrategy.SELECTIN: selectinload,
+    LoadingStrategy.JOINED: joinedload,
+    LoadingStrategy.RAISE: raiseload,
+}
+
+
+def nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def build_loading_plan(
+    model: DeclarativeMeta,
+    view_model: Type[BaseModel],
+    fields: Optional[Iterable[str]] = None,
+    overrides: Optional[dict[str, str]] = None,
+    prefix: str = "",
+    seen: frozenset = frozenset(),
+) -> List[ORMOption]:
+    if (model, view_model) in seen:
+        return [raiseload("*")]
+    seen = seen | {(model, view_model)}
+    overrides = overrides or {}
+    relationships = inspect(model).relationships
+    options = []
+
+    for name, field in view_model.model_fields.items():
+        if fields is not None and name not in fields:
+            continue
+        nested = nested_model(field.annotation)
+        if nested is None or name not in relationships:
+            continue
+
+        relationship = relationships[name]
+        path = f"{prefix}{name}"
+        default = (
+            LoadingStrategy.SELECTIN if relationship.uselist else LoadingStrategy.JOINED
+        )
+        strategy = LoadingStrategy(overrides.get(path, default))
+        if strategy == LoadingStrategy.JOINED and relationship.uselist:
+            raise ValueError(f"Collection {path} can not be joined-loaded")
+
+        loader = LOADERS[strategy](getattr(model, name))
+        if strategy != LoadingStrategy.RAISE:
+            loader = loader.options(
+                *build_loading_plan(
+                    relationship.mapper.class_,
+                    nested,
+                    overrides=overrides,
+                    prefix=f"{path}.",
+                    seen=seen,
+                ),
+            )
+        options.append(loader)
+
+    options.append(raiseload("*"))
+    return options
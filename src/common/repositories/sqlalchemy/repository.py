@@ -1,25 +1,59 @@
+import json
+from functools import partial
 from typing import (
     Any,
     AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
     Callable,
     Generic,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Type,
     TypeVar,
 )
 
 from pydantic import BaseModel as PydanticModel
 from pydantic._internal._model_construction import ModelMetaclass
-from sqlalchemy import Select, delete, func, inspect, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeMeta, collections
-
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Integer,
+    MetaData,
+    Result,
+    Row,
+    Select,
+    Table,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
+
+from src.common.exceptions.filters import FilterError
+from src.common.exceptions.repository import DuplicateRowsError
 from src.common.interfaces.repository import AsyncBaseRepositoryInterface
-from src.common.schemas.filters import Filter, ListFilter
-from src.database import BaseModel
+from src.common.schemas.filters import CountStrategy, Filter, ListFilter
+from src.database import UNIT_OF_WORK, BaseModel, run_after_commit
 
+from .converter import ViewConverter
+from .explain import Explain
 from .filter_builder import FilterBuilder
+from .loader import BatchLoader, get_loader
+from .loading import build_loading_plan
+from .statements import get_statement_cache
 
 ModelType = TypeVar("ModelType", bound=BaseModel, covariant=True)
 FilterSchemaType = TypeVar("FilterSchemaType", bound=Filter)
@@ -41,37 +75,256 @@ class SqlAlchemyRepository(
         ListFilterSchemaType,
     ],
 ):
+    bulk_chunk_size = 1000
+    unique_fields: Sequence[str] = ("id",)
+    loading: dict[str, str] = {}
+
     def _get_statement(self, filter_: FilterSchemaType, stmt: Select = None) -> Select:
         if stmt is None:
             stmt = select(self.model)
+        return stmt.where(*self._get_criteria(filter_))
+
+    def _get_criteria(self, filter_: FilterSchemaType) -> List[ColumnElement]:
+        return [
+            getattr(self.model, field) == value
+            for field, value in self._get_lookup(filter_).items()
+        ]
+
+    def _get_lookup(self, filter_: FilterSchemaType) -> dict[str, Any]:
+        return {
+            field: value
+            for field, value in filter_.dict(
+                exclude_unset=True,
+                exclude_none=True,
+            ).items()
+            if hasattr(self.model, field)
+        }
+
+    def _get_template(
+        self,
+        names: frozenset[str],
+        columns: Optional[List[InstrumentedAttribute]],
+        fields: Optional[frozenset[str]] = None,
+    ) -> Select:
+        stmt = self._get_select(columns).where(
+            *[
+                getattr(self.model, name)
+                == bindparam(f"p_{name}", type_=getattr(self.model, name).type)
+                for name in sorted(names)
+            ],
+        )
+        return self._apply_options(stmt, fields=fields)
 
-        for field, value in filter_.dict(exclude_unset=True, exclude_none=True).items():
-            if hasattr(self.model, field):
-                stmt = stmt.where(getattr(self.model, field) == value)
-
-        return stmt
+    def _get_loading_plan(
+        self,
+        view_model: ModelMetaclass,
+        fields: Optional[frozenset[str]] = None,
+    ) -> List[ORMOption]:
+        key = (view_model, fields)
+        if key not in self._loading_plans:
+            self._loading_plans[key] = build_loading_plan(
+                self.model,
+                view_model,
+                fields,
+                self.loading,
+            )
+        return self._loading_plans[key]
 
-    @staticmethod
-    def _apply_options(stmt: Select) -> Select:
-        return stmt
+    def _apply_options(
+        self,
+        stmt: Select,
+        view_model: Optional[ModelMetaclass] = None,
+        fields: Optional[frozenset[str]] = None,
+    ) -> Select:
+        if not any(column["expr"] is self.model for column in stmt.column_descriptions):
+            return stmt
+        return stmt.options(
+            *self._get_loading_plan(view_model or self.view_model, fields),
+        )
 
     def _apply_filters(
         self, filter_: ListFilterSchemaType, stmt: Select = None
     ) -> Select:
         if stmt is None:
             stmt = select(self.model)
-        return self.filter_builder.build(filter_, stmt)
+        return self.filter_builder.build_template(filter_, stmt)
 
-    def _get_list_statement(
+    def _get_list_template(
         self,
         filter_: ListFilterSchemaType,
         stmt: Select = None,
     ) -> Select:
         if stmt is None:
             stmt = select(self.model)
-        stmt = self._apply_options(stmt)
+        stmt = self._apply_options(stmt, fields=filter_.selected_fields)
         return self._apply_filters(filter_, stmt)
 
+    def _get_list_statement(
+        self,
+        filter_: ListFilterSchemaType,
+        stmt: Select = None,
+    ) -> Select:
+        stmt = self._get_list_template(filter_, stmt)
+        return stmt.params(self.filter_builder.get_params(filter_))
+
+    def _get_count_template(
+        self,
+        filter_: ListFilterSchemaType,
+        stmt: Select = None,
+    ) -> Select:
+        if stmt is None:
+            stmt = select(self.model)
+        stmt = self.filter_builder.build_filters_template(filter_, stmt)
+        return select(func.count()).select_from(stmt.subquery())
+
+    def _get_count_statement(
+        self,
+        filter_: ListFilterSchemaType,
+        stmt: Select = None,
+    ) -> Select:
+        stmt = self._get_count_template(filter_, stmt)
+        return stmt.params(self.filter_builder.get_filter_params(filter_))
+
+    def _get_projection(
+        self,
+        view_model: ModelMetaclass,
+        fields: Optional[frozenset[str]] = None,
+    ) -> Optional[List[InstrumentedAttribute]]:
+        key = (view_model, fields)
+        if key not in self._projections:
+            self._projections[key] = self._build_projection(view_model, fields)
+        return self._projections[key]
+
+    def _build_projection(
+        self,
+        view_model: ModelMetaclass,
+        fields: Optional[frozenset[str]] = None,
+    ) -> Optional[List[InstrumentedAttribute]]:
+        names = list(view_model.model_fields)
+        if fields is not None:
+            unknown = fields.difference(names)
+            if unknown:
+                raise FilterError(f"Unknown fields {', '.join(sorted(unknown))}")
+            names = [name for name in names if name in fields]
+
+        column_attrs = inspect(self.model).column_attrs
+        if any(name not in column_attrs for name in names):
+            return None
+        return [getattr(self.model, name) for name in names]
+
+    def _get_select(
+        self,
+        columns: Optional[List[InstrumentedAttribute]],
+        filter_: Optional[ListFilterSchemaType] = None,
+    ) -> Select:
+        if columns is None:
+            return select(self.model)
+        if filter_ is None:
+            return select(*columns)
+
+        keys = {column.key for column in columns}
+        ordering = [
+            column
+            for _, column, _ in self.filter_builder.get_ordering(filter_)
+            if column.key not in keys
+        ]
+        return select(*columns, *ordering)
+
+    def _get_converter(
+        self,
+        view_model: ModelMetaclass,
+        fields: Optional[frozenset[str]] = None,
+    ) -> ViewConverter:
+        key = (view_model, fields)
+        if key not in self._converters:
+            self._converters[key] = ViewConverter(view_model, fields)
+        return self._converters[key]
+
+    def _model_values(self, obj_in: PydanticModel | dict) -> dict[str, Any]:
+        if isinstance(obj_in, PydanticModel):
+            obj_in = obj_in.model_dump(exclude_unset=True)
+
+        column_attrs = inspect(self.model).column_attrs
+        return {name: value for name, value in obj_in.items() if name in column_attrs}
+
+    def _get_bulk_criteria(
+        self,
+        filter_: Optional[ListFilterSchemaType] = None,
+        ids: Optional[List[int]] = None,
+    ) -> List[ColumnElement]:
+        criteria = []
+        if ids is not None:
+            criteria.append(self.model.id.in_(ids))
+        if filter_ is not None:
+            criteria.extend(self.filter_builder.get_criteria(filter_))
+
+        if not criteria:
+            raise FilterError("Bulk operations require ids or filter conditions")
+        return criteria
+
+    def _get_returning(self) -> List[InstrumentedAttribute] | List[ModelType]:
+        return self._get_projection(self.view_model) or [self.model]
+
+    def _returning_to_pydantic(self, result: Result) -> List[ViewSchemaType]:
+        items = (
+            result.all() if self._get_projection(self.view_model) else result.scalars()
+        )
+        convert = self._get_converter(self.view_model)
+        return [convert(item) for item in items]
+
+    def _chunks(self, values: List[dict[str, Any]]) -> Iterator[List[dict[str, Any]]]:
+        for idx in range(0, len(values), self.bulk_chunk_size):
+            yield values[idx : idx + self.bulk_chunk_size]
+
+    def _get_conflict_target(
+        self,
+        table: Table,
+        conflict_fields: Optional[Sequence[str]] = None,
+    ) -> List[ColumnElement]:
+        return [table.c[name] for name in conflict_fields or self.unique_fields]
+
+    def _get_staging_table(self, names: Sequence[str]) -> Table:
+        columns = self.model.__table__.columns
+        return Table(
+            f"{self.model.__tablename__}_staging",
+            MetaData(),
+            Column("row", Integer),
+            *[Column(name, columns[name].type) for name in names],
+            prefixes=["TEMPORARY"],
+        )
+
+    @staticmethod
+    async def _copy_records(
+        connection: AsyncConnection,
+        table: Table,
+        records: List[tuple],
+    ) -> None:
+        names = [column.name for column in table.columns]
+        if connection.dialect.driver != "asyncpg":
+            values = [dict(zip(names, record)) for record in records]
+            await connection.execute(insert(table), values)
+            return
+
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=names,
+        )
+
+    async def _after_write(self, session: AsyncSession, ids: Sequence[Any]) -> None:
+        await run_after_commit(session, lambda: self._invalidate(ids))
+
+    async def _invalidate(self, ids: Sequence[Any]) -> None:
+        pass
+
+    @staticmethod
+    async def _commit(session: AsyncSession) -> None:
+        if session.info.get(UNIT_OF_WORK):
+            await session.flush()
+        else:
+            await session.commit()
+
     # flake8: noqa
     def _pydantic_to_model(
         self,
@@ -123,30 +376,13 @@ class SqlAlchemyRepository(
 
         return model
 
-    def _model_to_dict(self, model: BaseModel) -> dict[str | Any]:
-        model_dict = model.__dict__
-
-        for name, field in model_dict.items():
-            if isinstance(field, BaseModel):
-                model_dict[name] = self._model_to_dict(field)
-            elif isinstance(field, collections.InstrumentedList):
-                items = []
-                for i in list(field):
-                    if isinstance(i, BaseModel):
-                        items.append(self._model_to_dict(i))
-                    else:
-                        items.append(i)
-                model_dict[name] = items
-        return model_dict
-
     def _model_to_pydantic(
         self,
-        model: BaseModel,
+        model: BaseModel | Row,
         view_model: ModelMetaclass,
+        fields: Optional[frozenset[str]] = None,
     ) -> ViewSchemaType | SelectSchemaType:
-        return view_model.parse_obj(
-            self._model_to_dict(model),
-        )
+        return self._get_converter(view_model, fields)(model)
 
     def __init__(
         self,
@@ -154,50 +390,270 @@ class SqlAlchemyRepository(
         view_model: Type["ViewSchemaType"],
         session_factory: Callable[..., AsyncContextManager[AsyncSession]],
         filter_builder: Optional[FilterBuilder] = None,
+        read_session_factory: Optional[
+            Callable[..., AsyncContextManager[AsyncSession]]
+        ] = None,
+        stream_session_factory: Optional[
+            Callable[..., AsyncContextManager[AsyncSession]]
+        ] = None,
+        get_batch_session_factory: Optional[
+            Callable[[], Optional[Callable[..., AsyncContextManager[AsyncSession]]]]
+        ] = None,
+        primary_used: Optional[Callable[[], bool]] = None,
     ):
         self.model = model
         self.view_model = view_model
         self.session_factory = session_factory
+        self.read_session_factory = read_session_factory or session_factory
+        self.stream_session_factory = (
+            stream_session_factory or self.read_session_factory
+        )
+        self.get_batch_session_factory = get_batch_session_factory
+        self.primary_used = primary_used
+        self._projections: dict[
+            tuple[ModelMetaclass, Optional[frozenset[str]]],
+            Optional[List[InstrumentedAttribute]],
+        ] = {}
+        self._converters: dict[
+            tuple[ModelMetaclass, Optional[frozenset[str]]],
+            ViewConverter,
+        ] = {}
+        self._loading_plans: dict[
+            tuple[ModelMetaclass, Optional[frozenset[str]]],
+            List[ORMOption],
+        ] = {}
+        self._statements = get_statement_cache(type(self).__name__)
 
         if filter_builder:
             self.filter_builder = filter_builder
         else:
             self.filter_builder = FilterBuilder(model)
 
+    def _get_batch_session_factory(
+        self,
+    ) -> Optional[Callable[..., AsyncContextManager[AsyncSession]]]:
+        if self.get_batch_session_factory is None:
+            return None
+        return self.get_batch_session_factory()
+
+    def _get_loader(
+        self,
+        column: str,
+        load_many: Callable[..., Awaitable[dict[Any, Any]]],
+        session_factory: Callable[..., AsyncContextManager[AsyncSession]],
+    ) -> BatchLoader:
+        return get_loader(
+            (type(self), self.view_model, column, session_factory),
+            partial(load_many, session_factory),
+            self.bulk_chunk_size,
+            name=f"{self.model.__tablename__}:{column}",
+        )
+
+    async def _load_by_ids(
+        self,
+        session_factory: Callable[..., AsyncContextManager[AsyncSession]],
+        ids: List[Any],
+    ) -> dict[Any, ViewSchemaType]:
+        columns = self._get_projection(self.view_model)
+        stmt = self._statements.get(
+            ("load_many", self.view_model),
+            lambda: self._apply_options(self._get_select(columns)).where(
+                self.model.id
+                == any_(bindparam("ids", type_=ARRAY(self.model.id.type))),
+            ),
+        )
+
+        async with session_factory() as session:
+            result = await session.execute(stmt, {"ids": ids})
+            items = result.all() if columns else result.scalars()
+            return {
+                item.id: self._model_to_pydantic(item, self.view_model)
+                for item in items
+            }
+
     async def get(self, filter_: FilterSchemaType) -> Optional[ViewSchemaType]:
-        stmt = self._get_statement(filter_)
+        lookup = filter_.model_dump(exclude_none=True)
+        if lookup.keys() == {"id"}:
+            session_factory = self._get_batch_session_factory()
+            if session_factory is not None:
+                loader = self._get_loader("id", self._load_by_ids, session_factory)
+                return await loader.load(filter_.id)
+
+        columns = self._get_projection(self.view_model, filter_.selected_fields)
+        values = self._get_lookup(filter_)
+        names = frozenset(values)
+        stmt = self._statements.get(
+            ("get", self.view_model, filter_.selected_fields, names),
+            lambda: self._get_template(names, columns, filter_.selected_fields),
+        )
+        params = {f"p_{name}": value for name, value in values.items()}
 
-        async with self.session_factory() as session:
-            model = await session.scalar(stmt)
-            return (
-                self._model_to_pydantic(model, self.view_model)
-                if model is not None
-                else None
+        async with self.read_session_factory() as session:
+            result = await session.execute(stmt, params)
+            row = result.first()
+            if row is None:
+                return None
+            item = row if columns else row[0]
+            return self._model_to_pydantic(
+                item,
+                self.view_model,
+                filter_.selected_fields,
             )
 
-    async def get_list(self, filter_: ListFilterSchemaType) -> List[ViewSchemaType]:
-        stmt = self._get_list_statement(filter_)
-
-        async with self.session_factory() as session:
-            result = await session.scalars(stmt)
-            filter_.set_total(
-                await session.scalar(
-                    select(func.count()).select_from(
-                        stmt.offset(None).limit(None).order_by(None),
-                    ),
+    async def _count_estimate(
+        self,
+        session: AsyncSession,
+        filter_: ListFilterSchemaType,
+    ) -> int:
+        stmt = self.filter_builder.build_filters(filter_, select(self.model))
+
+        if stmt.whereclause is None:
+            total = await session.scalar(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)",
                 ),
+                {"table": self.model.__table__.fullname},
             )
-            return [self._model_to_pydantic(model, self.view_model) for model in result]
+        else:
+            plan = await session.scalar(Explain(stmt))
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            total = plan[0]["Plan"]["Plan Rows"]
+
+        return max(int(total or 0), 0)
+
+    async def _count(
+        self,
+        session: AsyncSession,
+        filter_: ListFilterSchemaType,
+    ) -> Optional[int]:
+        if filter_.count == CountStrategy.NONE:
+            return None
+        if filter_.count == CountStrategy.ESTIMATE:
+            return await self._count_estimate(session, filter_)
+        values = self.filter_builder.get_values(filter_)
+        stmt = self._statements.get(
+            ("count", self.filter_builder.template_key(filter_, values)),
+            lambda: self._get_count_template(filter_),
+        )
+        return await session.scalar(
+            stmt,
+            self.filter_builder.get_filter_params(filter_, values),
+        )
+
+    async def get_list(self, filter_: ListFilterSchemaType) -> List[ViewSchemaType]:
+        return await self._fetch_list(filter_)
+
+    async def _fetch_list(
+        self,
+        filter_: ListFilterSchemaType,
+    ) -> List[ViewSchemaType]:
+        columns = self._get_projection(self.view_model, filter_.selected_fields)
+        values = self.filter_builder.get_values(filter_)
+        windowed = filter_.count == CountStrategy.EXACT and not filter_.is_keyset
+        stmt = self._statements.get(
+            (
+                "list",
+                self.view_model,
+                filter_.selected_fields,
+                self.filter_builder.template_key(filter_, values),
+                windowed,
+            ),
+            lambda: self._build_list_template(filter_, columns, windowed),
+        )
+        params = self.filter_builder.get_params(filter_, values)
+
+        async with self.read_session_factory() as session:
+            result = await session.execute(stmt, params)
+            rows = result.all()
+
+            if windowed and rows:
+                filter_.set_total(rows[0].total)
+            elif windowed and not filter_.offset:
+                filter_.set_total(0)
+            else:
+                filter_.set_total(await self._count(session, filter_))
+
+            items = rows if columns else [row[0] for row in rows]
+            items = self.filter_builder.apply_cursors(filter_, items)
+            convert = self._get_converter(self.view_model, filter_.selected_fields)
+            return [convert(item) for item in items]
+
+    def _build_list_template(
+        self,
+        filter_: ListFilterSchemaType,
+        columns: Optional[List[InstrumentedAttribute]],
+        windowed: bool,
+    ) -> Select:
+        stmt = self._get_list_template(filter_, self._get_select(columns, filter_))
+        if windowed:
+            stmt = stmt.add_columns(func.count().over().label("total"))
+        return stmt
 
     async def get_all(
         self,
         filter_: ListFilterSchemaType,
     ) -> List[ViewSchemaType]:
-        stmt = self._get_list_statement(filter_)
+        columns = self._get_projection(self.view_model, filter_.selected_fields)
+        stmt = self._get_list_statement(filter_, self._get_select(columns))
 
-        async with self.session_factory() as session:
-            result = await session.scalars(stmt.limit(None).offset(None))
-            return [self._model_to_pydantic(model, self.view_model) for model in result]
+        async with self.read_session_factory() as session:
+            result = await session.execute(stmt.limit(None).offset(None))
+            items = result.all() if columns else result.scalars()
+            convert = self._get_converter(self.view_model, filter_.selected_fields)
+            return [convert(item) for item in items]
+
+    async def iterate(
+        self,
+        filter_: ListFilterSchemaType,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[ViewSchemaType]]:
+        filter_ = filter_.model_copy(
+            update={
+                "limit": batch_size,
+                "offset": 0,
+                "before": None,
+                "count": CountStrategy.NONE,
+            },
+        )
+        while True:
+            items = await self._fetch_list(filter_)
+            if items:
+                yield items
+
+            cursor = filter_.meta["next_cursor"]
+            if cursor is None:
+                return
+            filter_ = filter_.model_copy(update={"after": cursor})
+
+    async def stream(
+        self,
+        filter_: ListFilterSchemaType,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[ViewSchemaType]:
+        if filter_.before is not None:
+            raise FilterError("Streaming does not support the before cursor")
+
+        columns = self._get_projection(self.view_model, filter_.selected_fields)
+        stmt = self._get_list_statement(filter_, self._get_select(columns, filter_))
+        stmt = stmt.limit(None).offset(None).execution_options(yield_per=batch_size)
+        convert = self._get_converter(self.view_model, filter_.selected_fields)
+        return self._stream(stmt, columns is None, convert)
+
+    async def _stream(
+        self,
+        stmt: Select,
+        scalars: bool,
+        convert: ViewConverter,
+    ) -> AsyncIterator[ViewSchemaType]:
+        async with self.stream_session_factory() as session:
+            result = await session.stream(stmt)
+            if scalars:
+                result = result.scalars()
+            async for partition in result.partitions():
+                for item in partition:
+                    yield convert(item)
 
     async def create(self, obj_in: CreateSchemaType) -> Optional[ViewSchemaType]:
         model = self._pydantic_to_model(obj_in, self.model)
@@ -205,11 +661,107 @@ class SqlAlchemyRepository(
         async with self.session_factory() as session:
             session.add(model)
             await session.flush()
-            await session.commit()
-            return self._model_to_pydantic(model, self.view_model)
+            await self._commit(session)
+            await self._after_write(session, [model.id])
+
+        return self._model_to_pydantic(model, self.view_model)
+
+    async def create_or_ignore(
+        self,
+        obj_in: CreateSchemaType,
+        conflict_fields: Optional[Sequence[str]] = None,
+    ) -> Optional[ViewSchemaType]:
+        stmt = (
+            pg_insert(self.model)
+            .values(**self._model_values(obj_in))
+            .on_conflict_do_nothing(
+                index_elements=self._get_conflict_target(
+                    self.model.__table__,
+                    conflict_fields,
+                ),
+            )
+            .returning(*self._get_returning())
+        )
+        return await self._execute_upsert(stmt)
+
+    async def upsert(
+        self,
+        obj_in: CreateSchemaType,
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+    ) -> Optional[ViewSchemaType]:
+        stmt = self._get_upsert_statement(obj_in, conflict_fields, update_fields)
+        return await self._execute_upsert(stmt)
+
+    def _get_upsert_statement(
+        self,
+        obj_in: CreateSchemaType,
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+    ) -> Insert:
+        values = self._model_values(obj_in)
+        if update_fields is None:
+            keys = conflict_fields or self.unique_fields
+            update_fields = [name for name in values if name not in keys]
+
+        stmt = pg_insert(self.model).values(**values)
+        set_ = {name: stmt.excluded[name] for name in update_fields}
+        for column in self.model.__table__.columns:
+            if column.onupdate is not None and column.key not in set_:
+                set_[column.key] = column.onupdate.arg
+
+        return stmt.on_conflict_do_update(
+            index_elements=self._get_conflict_target(
+                self.model.__table__,
+                conflict_fields,
+            ),
+            set_=set_,
+        ).returning(*self._get_returning())
+
+    async def _execute_upsert(self, stmt: Insert) -> Optional[ViewSchemaType]:
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            views = self._returning_to_pydantic(result)
+            await self._commit(session)
+            await self._after_write(session, [view.id for view in views])
+
+        return views[0] if views else None
 
     async def update(
         self, obj_in: UpdateSchemaType, filter_: FilterSchemaType
+    ) -> Optional[ViewSchemaType]:
+        values = obj_in.model_dump(exclude_unset=True)
+        if any(name in inspect(self.model).relationships for name in values):
+            return await self._update_model(obj_in, filter_)
+
+        criteria = self._get_criteria(filter_)
+        if not criteria:
+            raise FilterError("Update requires filter conditions")
+
+        values = self._model_values(values)
+        if not values:
+            return await self.get(filter_)
+
+        stmt = (
+            update(self.model)
+            .where(*criteria)
+            .values(**values)
+            .returning(*self._get_returning())
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            views = self._returning_to_pydantic(result)
+            await self._commit(session)
+            await self._after_write(session, [view.id for view in views])
+
+        return views[0] if views else None
+
+    async def _update_model(
+        self,
+        obj_in: UpdateSchemaType,
+        filter_: FilterSchemaType,
     ) -> Optional[ViewSchemaType]:
         stmt = self._get_statement(filter_)
 
@@ -225,8 +777,10 @@ class SqlAlchemyRepository(
             if not model:
                 return None
 
-            await session.commit()
-            return self._model_to_pydantic(model, self.view_model)
+            await self._commit(session)
+            await self._after_write(session, [model.id])
+
+        return self._model_to_pydantic(model, self.view_model)
 
     async def delete(self, filter_: FilterSchemaType) -> bool:
         stmt = delete(self.model).where(self.model.id == filter_.id)
@@ -235,7 +789,161 @@ class SqlAlchemyRepository(
             result = await session.execute(stmt)
             await session.flush()
 
-            if result.rowcount > 0:
-                await session.commit()
-                return True
-            return False
+            if result.rowcount == 0:
+                return False
+            await self._commit(session)
+            await self._after_write(session, [filter_.id])
+
+        return True
+
+    async def create_many(
+        self,
+        objs_in: List[CreateSchemaType],
+    ) -> List[ViewSchemaType]:
+        values = [self._model_values(obj) for obj in objs_in]
+        stmt = (
+            pg_insert(self.model)
+            .on_conflict_do_nothing(
+                index_elements=self._get_conflict_target(self.model.__table__),
+            )
+            .returning(*self._get_returning())
+        )
+        views = []
+
+        async with self.session_factory() as session:
+            async with session.begin_nested() as savepoint:
+                for chunk in self._chunks(values):
+                    result = await session.execute(stmt, chunk)
+                    views.extend(self._returning_to_pydantic(result))
+
+                if len(views) < len(values):
+                    await savepoint.rollback()
+                    raise DuplicateRowsError(self._skipped_rows(values, views))
+            await self._commit(session)
+            await self._after_write(session, [view.id for view in views])
+
+        return views
+
+    def _skipped_rows(
+        self,
+        values: List[dict[str, Any]],
+        views: List[ViewSchemaType],
+    ) -> List[dict[str, Any]]:
+        inserted: dict[tuple, int] = {}
+        for view in views:
+            key = tuple(getattr(view, name) for name in self.unique_fields)
+            inserted[key] = inserted.get(key, 0) + 1
+
+        skipped = []
+        for row, item in enumerate(values):
+            key = tuple(item.get(name) for name in self.unique_fields)
+            if inserted.get(key):
+                inserted[key] -= 1
+            else:
+                skipped.append(
+                    {"row": row, **dict(zip(self.unique_fields, key))},
+                )
+        return skipped
+
+    async def import_many(
+        self,
+        objs_in: List[CreateSchemaType],
+        conflict_fields: Optional[Sequence[str]] = None,
+    ) -> List[Optional[int]]:
+        values = [self._model_values(obj) for obj in objs_in]
+        if not values:
+            return []
+
+        key_fields = list(conflict_fields or self.unique_fields)
+        names = [
+            column.key
+            for column in self.model.__table__.columns
+            if any(column.key in item for item in values)
+        ]
+        staging = self._get_staging_table(names)
+        records = [
+            (row, *[item.get(name) for name in names])
+            for row, item in enumerate(values)
+        ]
+
+        keys = self._get_conflict_target(staging, conflict_fields)
+        source = (
+            select(*[staging.c[name] for name in names])
+            .distinct(*keys)
+            .order_by(*keys, staging.c.row)
+        )
+        stmt = (
+            pg_insert(self.model)
+            .from_select(names, source)
+            .on_conflict_do_nothing(
+                index_elements=self._get_conflict_target(
+                    self.model.__table__,
+                    conflict_fields,
+                ),
+            )
+            .returning(
+                self.model.id,
+                *[getattr(self.model, name) for name in key_fields],
+            )
+        )
+
+        async with self.session_factory() as session:
+            connection = await session.connection()
+            await connection.run_sync(staging.create)
+            await self._copy_records(connection, staging, records)
+            result = await session.execute(stmt)
+            created = {tuple(row[1:]): row[0] for row in result}
+            await connection.run_sync(staging.drop)
+            await self._commit(session)
+            await self._after_write(session, list(created.values()))
+
+        return [
+            created.pop(tuple(item.get(name) for name in key_fields), None)
+            for item in values
+        ]
+
+    async def update_many(
+        self,
+        obj_in: UpdateSchemaType,
+        filter_: Optional[ListFilterSchemaType] = None,
+        ids: Optional[List[int]] = None,
+    ) -> List[ViewSchemaType]:
+        values = self._model_values(obj_in)
+        if not values:
+            return []
+
+        stmt = (
+            update(self.model)
+            .where(*self._get_bulk_criteria(filter_, ids))
+            .values(**values)
+            .returning(*self._get_returning())
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            views = self._returning_to_pydantic(result)
+            await self._commit(session)
+            await self._after_write(session, [view.id for view in views])
+
+        return views
+
+    async def delete_many(
+        self,
+        filter_: Optional[ListFilterSchemaType] = None,
+        ids: Optional[List[int]] = None,
+    ) -> int:
+        stmt = (
+            delete(self.model)
+            .where(*self._get_bulk_criteria(filter_, ids))
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            deleted = result.scalars().all()
+            await self._commit(session)
+            await self._after_write(session, deleted)
+
+        return len(deleted)
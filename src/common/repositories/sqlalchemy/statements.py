@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from sqlalchemy import Executable
+
+_caches: dict[str, "StatementCache"] = {}
+
+
+class StatementCache:
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._statements: OrderedDict[Hashable, Executable] = OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], Executable]) -> Executable:
+        stmt = self._statements.get(key)
+        if stmt is not None:
+            self.hits += 1
+            self._statements.move_to_end(key)
+            return stmt
+
+        self.misses += 1
+        stmt = self._statements[key] = build()
+        if len(self._statements) > self.max_size:
+            self._statements.popitem(last=False)
+        return stmt
+
+    def clear(self) -> None:
+        self._statements.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._statements),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def get_statement_cache(name: str) -> StatementCache:
+    if name not in _caches:
+        _caches[name] = StatementCache()
+    return _caches[name]
+
+
+def statement_cache_stats() -> dict[str, dict[str, Any]]:
+    return {name: cache.stats() for name, cache in _caches.items()}
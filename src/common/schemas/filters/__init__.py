@@ -1,4 +1,5 @@
 from . import base
+from .base import CountStrategy
 
 
 class Filter(base.BaseFilter):
@@ -10,6 +11,7 @@ class ListFilter(base.BaseListFilter):
 
 
 __all__ = [
+    "CountStrategy",
     "Filter",
     "ListFilter",
 ]
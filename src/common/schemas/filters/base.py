@@ -1,25 +1,68 @@
-from typing import Optional
+from enum import Enum
+from typing import Any, ClassVar, Optional
 
 from pydantic import BaseModel, Field, PrivateAttr
 
 
-class BaseFilter(BaseModel):
+class CountStrategy(str, Enum):
+    NONE = "none"
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
+class ProjectionMixin(BaseModel):
+    fields: Optional[str] = None
+
+    @property
+    def selected_fields(self) -> Optional[frozenset[str]]:
+        if not self.fields:
+            return None
+        return frozenset(
+            field.strip() for field in self.fields.split(",") if field.strip()
+        )
+
+
+class BaseFilter(ProjectionMixin):
     id: Optional[int]
 
 
-class BaseListFilter(BaseModel):
+class BaseListFilter(ProjectionMixin):
+    ordering: ClassVar[tuple[str, ...]] = ("id",)
+    orderable: ClassVar[tuple[str, ...]] = ("id",)
+
     limit: int = Field(100, gt=0)
     offset: int = Field(0, ge=0)
+    after: Optional[str] = None
+    before: Optional[str] = None
+    count: CountStrategy = CountStrategy.EXACT
+    order_by: Optional[str] = None
 
-    _total: int = PrivateAttr(0)
+    _total: Optional[int] = PrivateAttr(None)
+    _next_cursor: Optional[str] = PrivateAttr(None)
+    _prev_cursor: Optional[str] = PrivateAttr(None)
 
-    def set_total(self, value: int) -> None:
+    def set_total(self, value: Optional[int]) -> None:
         self._total = value
 
+    def set_cursors(
+        self,
+        next_cursor: Optional[str],
+        prev_cursor: Optional[str],
+    ) -> None:
+        self._next_cursor = next_cursor
+        self._prev_cursor = prev_cursor
+
+    @property
+    def is_keyset(self) -> bool:
+        return self.after is not None or self.before is not None
+
     @property
-    def meta(self) -> dict[str, int]:
+    def meta(self) -> dict[str, Any]:
         return {
             "total": self._total,
+            "count": self.count,
             "limit": self.limit,
             "offset": self.offset,
+            "next_cursor": self._next_cursor,
+            "prev_cursor": self._prev_cursor,
         }
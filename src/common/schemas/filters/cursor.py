@@ -0,0 +1,29 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any
+
+from src.common.exceptions.filters import InvalidCursorError
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(values: list[Any]) -> str:
+    raw = json.dumps(values, default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except ValueError:
+        raise InvalidCursorError(cursor) from None
+
+    if not isinstance(values, list):
+        raise InvalidCursorError(cursor)
+    return values
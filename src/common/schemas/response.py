@@ -1,21 +1,50 @@
-from typing import Generic, TypeVar
+from typing import Any, Generic, Optional, Sequence, TypeVar
 
 import pydantic as pd
-from pydantic.generics import GenericModel
+
+from src.common.schemas.filters import CountStrategy
 
 TypeModel = TypeVar("TypeModel", bound=pd.BaseModel)
 
 
-class BaseResponse(GenericModel):
+class BaseResponse(pd.BaseModel):
     ...
 
 
 class ResponseListMeta(pd.BaseModel):
-    total: int = pd.Field(0, ge=0)
+    total: Optional[int] = pd.Field(0, ge=0)
+    count: CountStrategy = CountStrategy.EXACT
     limit: int = pd.Field(100, ge=1)
     offset: int = pd.Field(0, ge=0)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class ResponseList(BaseResponse, Generic[TypeModel]):
     data: list[TypeModel]
     meta: ResponseListMeta = ResponseListMeta()
+
+    @classmethod
+    def from_trusted(
+        cls,
+        data: Sequence[TypeModel],
+        meta: dict[str, Any],
+    ) -> "ResponseList[TypeModel]":
+        return cls.model_construct(data=data, meta=ResponseListMeta(**meta))
+
+
+class ResponseBulkMeta(pd.BaseModel):
+    total: int = pd.Field(0, ge=0)
+
+
+class ResponseBulk(BaseResponse, Generic[TypeModel]):
+    data: list[TypeModel]
+    meta: ResponseBulkMeta = ResponseBulkMeta()
+
+    @classmethod
+    def from_trusted(cls, data: Sequence[TypeModel]) -> "ResponseBulk[TypeModel]":
+        return cls.model_construct(data=data, meta=ResponseBulkMeta(total=len(data)))
+
+
+class ResponseDeleted(pd.BaseModel):
+    deleted: int = pd.Field(0, ge=0)
@@ -0,0 +1,25 @@
+from typing import Any, Mapping, Optional
+
+import pydantic as pd
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+from starlette.background import BackgroundTask
+
+
+class ModelResponse(JSONResponse):
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        exclude_unset: bool = False,
+    ) -> None:
+        self.exclude_unset = exclude_unset
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, pd.BaseModel):
+            return content.model_dump_json(exclude_unset=self.exclude_unset).encode()
+        return to_json(content)
@@ -0,0 +1,42 @@
+from typing import Any
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from src.common.interfaces.cache import AsyncCacheInterface
+from src.common.repositories.sqlalchemy.loader import loader_stats
+from src.common.repositories.sqlalchemy.statements import statement_cache_stats
+from src.database import Database
+from src.user.revocation import RevocationList
+
+router = APIRouter(tags=["Метрики"])
+
+
+@router.get("/db")
+@inject
+async def db_metrics(
+    db: Database = Depends(Provide["db"]),
+) -> dict[str, Any]:
+    return {
+        "pool": db.pool_status(),
+        "replicas": db.replica_status(),
+        "loaders": loader_stats(),
+        "statements": statement_cache_stats(),
+        "compiled_cache": db.compiled_cache_status(),
+    }
+
+
+@router.get("/cache")
+@inject
+async def cache_metrics(
+    principal_cache: AsyncCacheInterface = Depends(Provide["principal_cache"]),
+    token_cache: AsyncCacheInterface = Depends(Provide["token_cache"]),
+    user_cache: AsyncCacheInterface = Depends(Provide["user_cache"]),
+    revocation_list: RevocationList = Depends(Provide["revocation_list"]),
+) -> dict[str, Any]:
+    return {
+        "principal": principal_cache.stats(),
+        "token": token_cache.stats(),
+        "user": user_cache.stats(),
+        "revocation": revocation_list.stats(),
+    }
@@ -1,19 +1,24 @@
+from datetime import datetime
 from typing import Optional
 
+from apscheduler.schedulers.base import BaseScheduler
 from fastapi import FastAPI
 
 
 class Configuration:
     routers: Optional[tuple]
     middlewares_class: Optional[tuple[type]]
+    jobs: Optional[tuple]
 
     def __init__(
         self,
         routers: Optional[tuple] = None,
         middlewares_class: Optional[tuple[type]] = None,
+        jobs: Optional[tuple] = None,
     ) -> None:
         self.routers = routers
         self.middlewares_class = middlewares_class
+        self.jobs = jobs
 
     def register_routes(self, app: FastAPI) -> None:
         if not self.routers:
@@ -28,3 +33,16 @@ class Configuration:
 
         for middleware in self.middlewares_class:
             app.add_middleware(middleware)
+
+    def register_jobs(self, scheduler: BaseScheduler) -> None:
+        if not self.jobs:
+            return None
+
+        for job, trigger in self.jobs:
+            scheduler.add_job(
+                job,
+                id=f"{job.__module__}.{job.__qualname__}",
+                replace_existing=True,
+                next_run_time=datetime.now(),
+                **trigger,
+            )
@@ -1,26 +1,101 @@
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dependency_injector import containers, providers
 
+from src.common.cache import MemoryCache
 from src.database import Database
-from src.user.private.repositories import UserRepository
-from src.user.services import UserService
+from src.user.hashing import PasswordHasher, process_pool
+from src.user.private.repositories import RevokedTokenRepository, UserRepository
+from src.user.revocation import RevocationList
+from src.user.services import TokenService, UserService
 
 
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(packages=["src"], auto_wire=True)
     config = providers.Configuration()
 
-    db = providers.Singleton(Database, db_url=config.DB_DSN)
+    db = providers.Singleton(
+        Database,
+        db_url=config.DB_DSN,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+        query_cache_size=config.DB_QUERY_CACHE_SIZE,
+        statement_timeout=config.DB_STATEMENT_TIMEOUT,
+        application_name=config.DB_APPLICATION_NAME,
+        replica_urls=config.DB_REPLICA_DSNS,
+        replica_balancing=config.DB_REPLICA_BALANCING,
+        replica_max_lag=config.DB_REPLICA_MAX_LAG,
+        replica_lag_check_interval=config.DB_REPLICA_LAG_CHECK_INTERVAL,
+        replica_lag_timeout=config.DB_REPLICA_LAG_TIMEOUT,
+    )
+    unit_of_work = db.provided.unit_of_work.call()
+
+    principal_cache = providers.Singleton(
+        MemoryCache,
+        max_size=config.AUTH_CACHE_SIZE,
+        ttl=config.AUTH_CACHE_TTL,
+    )
+    token_cache = providers.Singleton(
+        MemoryCache,
+        max_size=config.JWT_DECODE_CACHE_SIZE,
+        ttl=config.JWT_DECODE_CACHE_TTL,
+    )
+
+    revocation_list = providers.Singleton(RevocationList)
+    scheduler = providers.Singleton(AsyncIOScheduler)
+
+    user_cache = providers.Singleton(
+        MemoryCache,
+        max_size=config.USER_CACHE_SIZE,
+        ttl=config.USER_CACHE_TTL,
+    )
 
     repositories = providers.FactoryAggregate(
         user_repository=providers.Factory(
             UserRepository,
             session_factory=db.provided.get_session,
+            read_session_factory=db.provided.get_read_session,
+            stream_session_factory=db.provided.get_stream_session,
+            get_batch_session_factory=db.provided.get_batch_session_factory,
+            primary_used=db.provided.primary_used,
+            principal_cache=principal_cache,
+            cache=user_cache,
         ),
+        revoked_token_repository=providers.Factory(
+            RevokedTokenRepository,
+            session_factory=db.provided.get_session,
+            revocation_list=revocation_list,
+        ),
+    )
+
+    password_hasher = providers.Singleton(
+        PasswordHasher,
+        workers=config.PASSWORD_HASH_WORKERS,
+        queue_size=config.PASSWORD_HASH_QUEUE_SIZE,
+        schemes=config.PASSWORD_HASH_SCHEMES,
+        rounds=config.PASSWORD_HASH_ROUNDS,
+    )
+
+    import_pool = providers.Resource(
+        process_pool,
+        processes=config.USER_IMPORT_PROCESSES,
     )
 
     services = providers.FactoryAggregate(
         user_service=providers.Factory(
             UserService,
             repository=repositories.user_repository,
+            password_hasher=password_hasher,
+            import_batch_size=config.USER_IMPORT_BATCH_SIZE,
+            import_processes=config.USER_IMPORT_PROCESSES,
+            import_executor=import_pool,
+        ),
+        token_service=providers.Factory(
+            TokenService,
+            repository=repositories.revoked_token_repository,
+            revocation_list=revocation_list,
         ),
     )
@@ -1,31 +1,353 @@
+import asyncio
+import itertools
+import time
+from collections import Counter
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Sequence
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event, exc, make_url, text
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from src.settings import setting
+from src.utils.tasks import spawn_detached
 
 BaseModel = declarative_base()
 
+UNIT_OF_WORK = "unit_of_work"
+AFTER_COMMIT = "after_commit"
+ROLLBACK_ONLY = "rollback_only"
+
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END",
+)
+
+
+class ReplicaBalancing(str, Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    wait_count: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    timeouts: int = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.wait_count += 1
+            self.wait_time_total += elapsed
+            self.wait_time_max = max(self.wait_time_max, elapsed)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "wait_count": self.wait_count,
+            "wait_time_total": self.wait_time_total,
+            "wait_time_max": self.wait_time_max,
+            "timeouts": self.timeouts,
+        }
+
+
+async def run_after_commit(
+    session: AsyncSession,
+    callback: Callable[[], Awaitable[None]],
+) -> None:
+    callbacks = session.info.get(AFTER_COMMIT)
+    if callbacks is None:
+        await callback()
+    else:
+        callbacks.append(callback)
+
+
+def set_rollback_only(session: AsyncSession) -> None:
+    session.info[ROLLBACK_ONLY] = True
+
+
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.session_factory = create_session_factory(engine)
+        self.lag: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.checking = False
+
+    def is_stale(self, interval: float) -> bool:
+        if self.checking:
+            return False
+        return self.checked_at is None or time.monotonic() - self.checked_at >= interval
+
+    def refresh_lag(self, timeout: float) -> None:
+        self.checking = True
+        spawn_detached(self.check_lag(timeout))
+
+    async def check_lag(self, timeout: float) -> None:
+        self.checking = True
+        try:
+            lag = await asyncio.wait_for(self._fetch_lag(), timeout)
+            self.lag = float(lag or 0)
+        except (exc.SQLAlchemyError, OSError, asyncio.TimeoutError):
+            self.lag = None
+        finally:
+            self.checked_at = time.monotonic()
+            self.checking = False
+
+    async def _fetch_lag(self) -> Any:
+        async with self.engine.connect() as conn:
+            return await conn.scalar(REPLICA_LAG_QUERY)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "url": self.engine.url.render_as_string(hide_password=True),
+            "lag": self.lag,
+            "pool": self.engine.pool.status(),
+        }
+
 
 class Database:
-    def __init__(self, db_url: str) -> None:
-        self._engine = create_async_engine(db_url, echo=setting.DEBUG)
-        self._async_session = async_sessionmaker(
-            bind=self._engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-            autocommit=False,
-            autoflush=False,
+    def __init__(
+        self,
+        db_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        statement_cache_size: int = 100,
+        query_cache_size: int = 500,
+        statement_timeout: Optional[int] = None,
+        application_name: Optional[str] = None,
+        replica_urls: Optional[str | Sequence[str]] = None,
+        replica_balancing: str = ReplicaBalancing.ROUND_ROBIN,
+        replica_max_lag: float = 5,
+        replica_lag_check_interval: float = 5,
+        replica_lag_timeout: float = 1,
+    ) -> None:
+        self._engine_options = {
+            "echo": setting.DEBUG,
+            "poolclass": MeasuredQueuePool,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+            "query_cache_size": query_cache_size,
+        }
+        self._connect_options = {
+            "statement_cache_size": statement_cache_size,
+            "statement_timeout": statement_timeout,
+            "application_name": application_name,
+        }
+        self._compiled_cache_stats: Counter[str] = Counter()
+        self._engine = self._create_engine(db_url)
+        self._async_session = create_session_factory(self._engine)
+        self._ambient_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+            f"ambient_session_{id(self)}",
+            default=None,
+        )
+
+        if isinstance(replica_urls, str):
+            replica_urls = [url.strip() for url in replica_urls.split(",")]
+        self._replicas = [
+            Replica(self._create_engine(url)) for url in replica_urls or () if url
+        ]
+        self._replica_balancing = ReplicaBalancing(replica_balancing)
+        self._replica_max_lag = replica_max_lag
+        self._replica_lag_check_interval = replica_lag_check_interval
+        self._replica_lag_timeout = replica_lag_timeout
+        self._replica_counter = itertools.count()
+        self._primary_used: ContextVar[bool] = ContextVar(
+            f"primary_used_{id(self)}",
+            default=False,
         )
 
+    def _create_engine(self, db_url: str) -> AsyncEngine:
+        engine = create_async_engine(
+            db_url,
+            **self._engine_options,
+            connect_args=self._get_connect_args(db_url, **self._connect_options),
+        )
+        event.listen(engine.sync_engine, "after_cursor_execute", self._count_cache_hit)
+        return engine
+
+    def _count_cache_hit(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool,
+    ) -> None:
+        if context is not None and context.compiled is not None:
+            self._compiled_cache_stats[context.cache_hit.name.lower()] += 1
+
+    @staticmethod
+    def _get_connect_args(
+        db_url: str,
+        statement_cache_size: int,
+        statement_timeout: Optional[int],
+        application_name: Optional[str],
+    ) -> dict[str, Any]:
+        if make_url(db_url).get_driver_name() != "asyncpg":
+            return {}
+
+        server_settings = {}
+        if statement_timeout:
+            server_settings["statement_timeout"] = str(statement_timeout)
+        if application_name:
+            server_settings["application_name"] = application_name
+
+        return {
+            "prepared_statement_cache_size": statement_cache_size,
+            "statement_cache_size": statement_cache_size,
+            "server_settings": server_settings,
+        }
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        return [self._engine, *[replica.engine for replica in self._replicas]]
+
+    def pool_status(self) -> dict[str, Any]:
+        return self._engine.pool.status()
+
+    def compiled_cache_status(self) -> dict[str, Any]:
+        return {
+            "size": self._engine_options["query_cache_size"],
+            **self._compiled_cache_stats,
+        }
+
+    def replica_status(self) -> list[dict[str, Any]]:
+        return [replica.status() for replica in self._replicas]
+
+    def _choose_replica(self) -> Optional[Replica]:
+        if not self._replicas:
+            return None
+
+        for replica in self._replicas:
+            if replica.is_stale(self._replica_lag_check_interval):
+                replica.refresh_lag(self._replica_lag_timeout)
+
+        healthy = [
+            replica
+            for replica in self._replicas
+            if replica.lag is not None and replica.lag <= self._replica_max_lag
+        ]
+        if not healthy:
+            return None
+        if self._replica_balancing == ReplicaBalancing.LEAST_CONNECTIONS:
+            return min(healthy, key=lambda replica: replica.engine.pool.checkedout())
+        return healthy[next(self._replica_counter) % len(healthy)]
+
+    def primary_used(self) -> bool:
+        return self._primary_used.get()
+
     def create_database(self) -> None:
         BaseModel.metadata.create_all(self._engine)
 
+    @asynccontextmanager
+    async def _get_primary_session(self) -> AsyncIterator[AsyncSession]:
+        session = self._ambient_session.get()
+        if session is not None:
+            yield session
+            return
+
+        async with self._async_session() as session:
+            yield session
+
     @asynccontextmanager
     async def get_session(
         self,
     ) -> AsyncIterator[AsyncSession]:
-        async with self._async_session() as session:
+        self._primary_used.set(True)
+        async with self._get_primary_session() as session:
             yield session
+
+    @asynccontextmanager
+    async def get_read_session(self) -> AsyncIterator[AsyncSession]:
+        replica = None
+        if not self._primary_used.get():
+            replica = self._choose_replica()
+
+        if replica is None:
+            async with self._get_primary_session() as session:
+                yield session
+            return
+
+        async with replica.session_factory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def get_stream_session(self) -> AsyncIterator[AsyncSession]:
+        replica = None
+        if not self._primary_used.get():
+            replica = self._choose_replica()
+
+        session_factory = replica.session_factory if replica else self._async_session
+        async with session_factory() as session:
+            yield session
+
+    def get_batch_session_factory(self) -> Optional[async_sessionmaker]:
+        if self._primary_used.get():
+            return None
+
+        replica = self._choose_replica()
+        if replica is not None:
+            return replica.session_factory
+        if self._ambient_session.get() is not None:
+            return None
+        return self._async_session
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[AsyncSession]:
+        async with self._async_session() as session:
+            session.info[UNIT_OF_WORK] = True
+            session.info[AFTER_COMMIT] = callbacks = []
+            token = self._ambient_session.set(session)
+            try:
+                yield session
+                if session.info.get(ROLLBACK_ONLY):
+                    callbacks.clear()
+                    await session.rollback()
+                else:
+                    await session.commit()
+            except BaseException:
+                await session.rollback()
+                raise
+            finally:
+                self._ambient_session.reset(token)
+
+        for callback in callbacks:
+            await callback()
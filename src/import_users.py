@@ -0,0 +1,40 @@
+import argparse
+import asyncio
+import sys
+
+from src.containers import Container
+from src.settings import setting
+from src.utils.export import ExportFormat
+from src.utils.imports import READERS
+
+
+async def import_users(path: str, format_: ExportFormat) -> int:
+    container = Container()
+    container.config.from_dict(setting.dict())
+    user_service = container.services.user_service()
+
+    total = created = failed = 0
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        async for report in user_service.import_objects(READERS[format_](file)):
+            for error in report.errors:
+                sys.stderr.write(f"row {error.row}: {error.field}: {error.message}\n")
+            total += report.total
+            created += report.created
+            failed += len({error.row for error in report.errors})
+            sys.stdout.write(f"processed {total}, created {created}, failed {failed}\n")
+    container.shutdown_resources()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import users from a file")
+    parser.add_argument("path")
+    parser.add_argument(
+        "--format",
+        dest="format_",
+        type=ExportFormat,
+        choices=list(ExportFormat),
+        default=ExportFormat.CSV,
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(import_users(args.path, args.format_)))
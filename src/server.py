@@ -1,12 +1,33 @@
 from fastapi import FastAPI
 
+from src.common.middlewares.unit_of_work import UnitOfWorkMiddleware
+from src.common.web.rest import metrics_router
 from src.configuration import Configuration
 from src.containers import Container
 from src.settings import setting
+from src.user.jobs import compact_revoked_tokens, sync_revoked_tokens
 from src.user.web.rest import auth_router, user_router
 
-__routers__ = Configuration(routers=((user_router, "/user"), (auth_router, "/auth")))
-__middleware__ = Configuration(middlewares_class=None)
+__routers__ = Configuration(
+    routers=(
+        (user_router, "/user"),
+        (auth_router, "/auth"),
+        (metrics_router, "/metrics"),
+    ),
+)
+__middleware__ = Configuration(middlewares_class=(UnitOfWorkMiddleware,))
+__jobs__ = Configuration(
+    jobs=(
+        (
+            sync_revoked_tokens,
+            {"trigger": "interval", "seconds": setting.REVOCATION_SYNC_INTERVAL},
+        ),
+        (
+            compact_revoked_tokens,
+            {"trigger": "interval", "seconds": setting.REVOCATION_COMPACT_INTERVAL},
+        ),
+    ),
+)
 
 
 class Server:
@@ -17,6 +38,7 @@ class Server:
         self.__register_middleware(app)
         self.__register_routes(app)
         self.__register_di_container(app)
+        self.__register_scheduler(app)
 
     def get_app(self) -> FastAPI:
         return self.__app
@@ -34,3 +56,17 @@ class Server:
         container = Container()
         container.config.from_dict(setting.dict())
         app.container = container
+
+    @staticmethod
+    def __register_scheduler(app: FastAPI) -> None:
+        async def start() -> None:
+            scheduler = app.container.scheduler()
+            __jobs__.register_jobs(scheduler)
+            scheduler.start()
+
+        async def shutdown() -> None:
+            app.container.scheduler().shutdown(wait=False)
+            app.container.shutdown_resources()
+
+        app.add_event_handler("startup", start)
+        app.add_event_handler("shutdown", shutdown)
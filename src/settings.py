@@ -23,6 +23,36 @@ class Settings(BaseSettings):
     DB_USER: str = Field(env="DB_USER")
     DB_PASSWORD: str = Field(env="DB_PASSWORD")
     DB_DSN: Optional[str] = Field(None, env="DB_DSN")
+    DB_POOL_SIZE: int = Field(5, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(10, env="DB_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT: float = Field(30, env="DB_POOL_TIMEOUT")
+    DB_POOL_RECYCLE: int = Field(1800, env="DB_POOL_RECYCLE")
+    DB_POOL_PRE_PING: bool = Field(True, env="DB_POOL_PRE_PING")
+    DB_STATEMENT_CACHE_SIZE: int = Field(100, env="DB_STATEMENT_CACHE_SIZE")
+    DB_QUERY_CACHE_SIZE: int = Field(500, env="DB_QUERY_CACHE_SIZE")
+    DB_STATEMENT_TIMEOUT: int = Field(60000, env="DB_STATEMENT_TIMEOUT")
+    DB_APPLICATION_NAME: str = Field("fastapi_template", env="DB_APPLICATION_NAME")
+    DB_REPLICA_DSNS: Optional[str] = Field(None, env="DB_REPLICA_DSNS")
+    DB_REPLICA_BALANCING: str = Field("round_robin", env="DB_REPLICA_BALANCING")
+    DB_REPLICA_MAX_LAG: float = Field(5, env="DB_REPLICA_MAX_LAG")
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = Field(
+        5,
+        env="DB_REPLICA_LAG_CHECK_INTERVAL",
+    )
+    DB_REPLICA_LAG_TIMEOUT: float = Field(1, env="DB_REPLICA_LAG_TIMEOUT")
+
+    AUTH_CACHE_TTL: float = Field(60, env="AUTH_CACHE_TTL")
+    AUTH_CACHE_SIZE: int = Field(10000, env="AUTH_CACHE_SIZE")
+
+    PASSWORD_HASH_WORKERS: int = Field(2, env="PASSWORD_HASH_WORKERS")
+    PASSWORD_HASH_QUEUE_SIZE: int = Field(32, env="PASSWORD_HASH_QUEUE_SIZE")
+    PASSWORD_HASH_SCHEMES: str = Field("bcrypt", env="PASSWORD_HASH_SCHEMES")
+    PASSWORD_HASH_ROUNDS: Optional[int] = Field(None, env="PASSWORD_HASH_ROUNDS")
+
+    USER_CACHE_TTL: float = Field(30, env="USER_CACHE_TTL")
+    USER_CACHE_SIZE: int = Field(1000, env="USER_CACHE_SIZE")
+    USER_IMPORT_BATCH_SIZE: int = Field(5000, env="USER_IMPORT_BATCH_SIZE")
+    USER_IMPORT_PROCESSES: Optional[int] = Field(None, env="USER_IMPORT_PROCESSES")
 
     JWT_ALGORITHM: str = Field(env="JWT_ALGORITHM")
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(env="JWT_ACCESS_TOKEN_EXPIRE_MINUTES")
@@ -31,6 +61,18 @@ class Settings(BaseSettings):
     )
     JWT_SECRET_KEY: str = Field(env="JWT_SECRET_KEY")
     JWT_REFRESH_SECRET_KEY: str = Field(env="JWT_REFRESH_SECRET_KEY")
+    JWT_REFRESH_ALGORITHM: str = Field("HS256", env="JWT_REFRESH_ALGORITHM")
+    JWT_PRIVATE_KEY: Optional[str] = Field(None, env="JWT_PRIVATE_KEY")
+    JWT_PUBLIC_KEY: Optional[str] = Field(None, env="JWT_PUBLIC_KEY")
+    JWT_STATELESS_PRINCIPAL: bool = Field(False, env="JWT_STATELESS_PRINCIPAL")
+    JWT_DECODE_CACHE_TTL: float = Field(300, env="JWT_DECODE_CACHE_TTL")
+    JWT_DECODE_CACHE_SIZE: int = Field(10000, env="JWT_DECODE_CACHE_SIZE")
+
+    REVOCATION_SYNC_INTERVAL: float = Field(5, env="REVOCATION_SYNC_INTERVAL")
+    REVOCATION_COMPACT_INTERVAL: float = Field(
+        3600,
+        env="REVOCATION_COMPACT_INTERVAL",
+    )
 
     @no_type_check
     @field_validator("DB_DSN")
@@ -1,17 +1,48 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Optional
+from uuid import uuid4
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
+from src.common.interfaces.cache import AsyncCacheInterface
 from src.settings import setting
 from src.user import schemas as sc
 from src.user.exceptions import credentials_exception
 from src.user.private.repositories import UserRepository
+from src.user.revocation import RevocationList
 
 token_scheme = OAuth2PasswordBearer(tokenUrl="/signin")
 
+ASYMMETRIC_ALGORITHMS = ("ES", "RS", "PS")
+
+
+@lru_cache()
+def get_access_keys() -> tuple[Optional[Key], Key]:
+    algorithm = setting.JWT_ALGORITHM
+    if not algorithm.startswith(ASYMMETRIC_ALGORITHMS):
+        key = jwk.construct(setting.JWT_SECRET_KEY, algorithm)
+        return key, key
+
+    signing_key = None
+    if setting.JWT_PRIVATE_KEY:
+        signing_key = jwk.construct(setting.JWT_PRIVATE_KEY, algorithm)
+    return signing_key, jwk.construct(setting.JWT_PUBLIC_KEY, algorithm)
+
+
+@lru_cache()
+def get_refresh_key() -> Key:
+    return jwk.construct(
+        setting.JWT_REFRESH_SECRET_KEY,
+        setting.JWT_REFRESH_ALGORITHM,
+    )
+
 
 class Auth:
     @inject
@@ -19,41 +50,84 @@ class Auth:
         self,
         token: str = Depends(token_scheme),
         repository: UserRepository = Depends(Provide["repositories.user_repository"]),
-    ) -> sc.UserUnprotectedView:
-        try:
-            payload = jwt.decode(
-                token=token,
-                key=setting.JWT_SECRET_KEY,
-                algorithms="HS256",
-            )
-            email = payload.get("sub")
-            if email is None:
-                raise credentials_exception from None
-        except JWTError:
+        cache: AsyncCacheInterface = Depends(Provide["principal_cache"]),
+        token_cache: AsyncCacheInterface = Depends(Provide["token_cache"]),
+        revocation_list: RevocationList = Depends(Provide["revocation_list"]),
+    ) -> sc.UserView:
+        payload = await self.decode_access_token(token, token_cache)
+        email = payload.get("sub")
+        if email is None or revocation_list.is_revoked(payload.get("jti")):
             raise credentials_exception from None
+
+        if setting.JWT_STATELESS_PRINCIPAL and "user" in payload:
+            return sc.UserView.model_validate(payload["user"])
+
+        user = await cache.get(email)
+        if user is not None:
+            return user
+
         user = await repository.get_by_email(email)
         if user is None:
             raise credentials_exception from None
+        await cache.set(email, user)
         return user
 
     @staticmethod
-    def check_refresh_token(token: str) -> str:
+    async def decode_access_token(
+        token: str,
+        token_cache: AsyncCacheInterface,
+    ) -> dict[str, Any]:
+        key = hashlib.sha256(token.encode()).hexdigest()
+        payload = await token_cache.get(key)
+        if payload is not None:
+            return payload
+
         try:
             payload = jwt.decode(
                 token=token,
-                key=setting.JWT_REFRESH_SECRET_KEY,
+                key=get_access_keys()[1],
                 algorithms=setting.JWT_ALGORITHM,
             )
-            email = payload.get("sub")
-            if email is None:
-                raise credentials_exception from None
         except JWTError:
             raise credentials_exception from None
-        return email
+
+        ttl = setting.JWT_DECODE_CACHE_TTL
+        if "exp" in payload:
+            ttl = min(ttl, payload["exp"] - time.time())
+        await token_cache.set(key, payload, ttl)
+        return payload
+
+    @staticmethod
+    def decode_refresh_token(token: str) -> dict[str, Any]:
+        try:
+            payload = jwt.decode(
+                token=token,
+                key=get_refresh_key(),
+                algorithms=setting.JWT_REFRESH_ALGORITHM,
+            )
+        except JWTError:
+            raise credentials_exception from None
+        if payload.get("sub") is None:
+            raise credentials_exception from None
+        return payload
+
+    @staticmethod
+    def principal_claims(user: sc.UserView) -> dict[str, Any]:
+        claims: dict[str, Any] = {"sub": user.email}
+        if setting.JWT_STATELESS_PRINCIPAL:
+            claims["user"] = user.model_dump(
+                mode="json",
+                include=set(sc.UserView.model_fields),
+            )
+        return claims
 
     @staticmethod
     def create_access_token(data: dict) -> str:
-        to_encode = data.copy()
+        signing_key = get_access_keys()[0]
+        if signing_key is None:
+            raise RuntimeError("JWT_PRIVATE_KEY is required to issue access tokens")
+
+        to_encode = {**data, "jti": uuid4().hex}
         if setting.JWT_ACCESS_TOKEN_EXPIRE_MINUTES:
             to_encode.update(
                 {
@@ -63,14 +137,14 @@ class Auth:
             )
         token = jwt.encode(
             to_encode,
-            setting.JWT_SECRET_KEY,
+            signing_key,
             algorithm=setting.JWT_ALGORITHM,
         )
         return token
 
     @staticmethod
     def create_refresh_token(data: dict) -> str:
-        to_encode = data.copy()
+        to_encode = {**data, "jti": uuid4().hex}
         if setting.JWT_REFRESH_TOKEN_EXPIRE_MINUTES:
             to_encode.update(
                 {
@@ -80,7 +154,7 @@ class Auth:
             )
         token = jwt.encode(
             to_encode,
-            setting.JWT_REFRESH_SECRET_KEY,
-            algorithm="HS256",
+            get_refresh_key(),
+            algorithm=setting.JWT_REFRESH_ALGORITHM,
         )
         return token
@@ -6,6 +6,15 @@ class UserEmailExistsError(Exception):
         self.email = email
 
 
+class PasswordHasherOverloadedError(Exception):
+    ...
+
+
+class UserImportTooLargeError(Exception):
+    def __init__(self, max_rows: int):
+        self.max_rows = max_rows
+
+
 credentials_exception = HTTPException(
     status_code=401,
     detail="Could not validate credentials",
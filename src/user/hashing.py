@@ -0,0 +1,122 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Iterator, List, Optional, Sequence, TypeVar
+
+from passlib.context import CryptContext
+
+from src.user.exceptions import PasswordHasherOverloadedError
+
+T = TypeVar("T")
+
+
+def create_crypt_context(
+    schemes: str | Sequence[str] = "bcrypt",
+    rounds: Optional[int] = None,
+) -> CryptContext:
+    if isinstance(schemes, str):
+        schemes = [scheme.strip() for scheme in schemes.split(",") if scheme.strip()]
+
+    options = {}
+    if rounds:
+        options[f"{schemes[0]}__rounds"] = rounds
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+@lru_cache()
+def get_crypt_context(schemes: str, rounds: Optional[int] = None) -> CryptContext:
+    return create_crypt_context(schemes, rounds)
+
+
+def hash_passwords(
+    passwords: List[str],
+    schemes: str,
+    rounds: Optional[int] = None,
+) -> List[str]:
+    context = get_crypt_context(schemes, rounds)
+    return [context.hash(password) for password in passwords]
+
+
+def create_process_pool(processes: Optional[int] = None) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def process_pool(processes: Optional[int] = None) -> Iterator[ProcessPoolExecutor]:
+    executor = create_process_pool(processes)
+    try:
+        yield executor
+    finally:
+        executor.shutdown()
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 32,
+        schemes: str | Sequence[str] = "bcrypt",
+        rounds: Optional[int] = None,
+    ) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self.schemes = schemes if isinstance(schemes, str) else ",".join(schemes)
+        self.rounds = rounds
+        self.context = create_crypt_context(schemes, rounds)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hasher",
+        )
+        self._pending = 0
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._pending >= self.workers + self.queue_size:
+            raise PasswordHasherOverloadedError
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        hashes: List[str] = []
+        for idx in range(0, len(passwords), self.workers):
+            chunk = passwords[idx : idx + self.workers]
+            hashes.extend(await asyncio.gather(*[self.hash(item) for item in chunk]))
+        return hashes
+
+    async def hash_batch(
+        self,
+        passwords: List[str],
+        executor: Executor,
+        chunks: int,
+    ) -> List[str]:
+        loop = asyncio.get_running_loop()
+        size = max(1, -(-len(passwords) // max(1, chunks)))
+        hashes = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    executor,
+                    hash_passwords,
+                    passwords[idx : idx + size],
+                    self.schemes,
+                    self.rounds,
+                )
+                for idx in range(0, len(passwords), size)
+            ],
+        )
+        return list(chain.from_iterable(hashes))
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        return self.context.needs_update(hashed_password)
@@ -1,5 +1,6 @@
 import abc
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
 from src.common.interfaces.repository import AsyncBaseRepositoryInterface
 from src.user import schemas as sc
@@ -18,3 +19,38 @@ class UserRepositoryInterface(
     @abc.abstractmethod
     async def get_by_email(self, email: str) -> Optional[sc.UserUnprotectedView]:
         pass
+
+    @abc.abstractmethod
+    async def update_password(
+        self,
+        id: int,
+        old_password: str,
+        new_password: str,
+    ) -> bool:
+        pass
+
+
+class RevokedTokenRepositoryInterface(
+    abc.ABC,
+    AsyncBaseRepositoryInterface[
+        sc.RevokedTokenFilter,
+        sc.RevokedTokenListFilter,
+        sc.RevokedTokenCreate,
+        sc.RevokedTokenCreate,
+        sc.RevokedTokenView,
+    ],
+):
+    @abc.abstractmethod
+    async def get_active(
+        self,
+        since: Optional[datetime] = None,
+    ) -> List[sc.RevokedTokenView]:
+        pass
+
+    @abc.abstractmethod
+    async def revoke(self, obj_in: sc.RevokedTokenCreate) -> bool:
+        pass
+
+    @abc.abstractmethod
+    async def delete_expired(self) -> int:
+        pass
@@ -0,0 +1,17 @@
+from dependency_injector.wiring import Provide, inject
+
+from src.user.services import TokenService
+
+
+@inject
+async def sync_revoked_tokens(
+    token_service: TokenService = Provide["services.token_service"],
+) -> None:
+    await token_service.sync()
+
+
+@inject
+async def compact_revoked_tokens(
+    token_service: TokenService = Provide["services.token_service"],
+) -> None:
+    await token_service.compact()
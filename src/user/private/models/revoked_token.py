@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.common.mixins.models import PrimaryKeyMixin
+from src.database import BaseModel
+
+
+class RevokedToken(BaseModel, PrimaryKeyMixin):
+    __tablename__ = "revoked_tokens"
+    __table_args__ = (UniqueConstraint("jti", name="uq_revoked_tokens_jti"),)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    jti: Mapped[str] = mapped_column(String(64))
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        index=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        index=True,
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import String
+from sqlalchemy import Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.common.mixins.models import CreatedUpdatedMixin, PrimaryKeyMixin
@@ -7,6 +7,10 @@ from src.database import BaseModel
 
 class User(BaseModel, PrimaryKeyMixin, CreatedUpdatedMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("uq_users_email_lower", text("lower(email)"), unique=True),
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(String(120))
     first_name: Mapped[str] = mapped_column(String(120))
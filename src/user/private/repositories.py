@@ -1,17 +1,39 @@
-from typing import AsyncContextManager, Callable, Optional
+from datetime import datetime
+from typing import AsyncContextManager, Callable, Iterable, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    Table,
+    bindparam,
+    delete,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.common.repositories.sqlalchemy import SqlAlchemyRepository
+from src.common.interfaces.cache import AsyncCacheInterface
+from src.common.repositories.sqlalchemy import (
+    CachedRepositoryMixin,
+    SqlAlchemyRepository,
+)
+from src.database import run_after_commit
 from src.user import schemas as sc
-from src.user.interfaces import UserRepositoryInterface
+from src.user.interfaces import RevokedTokenRepositoryInterface, UserRepositoryInterface
+from src.user.revocation import RevocationList
 
+from .models.revoked_token import RevokedToken
 from .models.user import User
 
 
 class UserRepository(
     UserRepositoryInterface,
+    CachedRepositoryMixin,
     SqlAlchemyRepository[
         User,
         sc.UserView,
@@ -21,22 +43,326 @@ class UserRepository(
         sc.UserListFilter,
     ],
 ):
+    unique_fields = ("email",)
+
     def __init__(
         self,
         session_factory: Callable[..., AsyncContextManager[AsyncSession]],
+        read_session_factory: Optional[
+            Callable[..., AsyncContextManager[AsyncSession]]
+        ] = None,
+        stream_session_factory: Optional[
+            Callable[..., AsyncContextManager[AsyncSession]]
+        ] = None,
+        get_batch_session_factory: Optional[
+            Callable[[], Optional[Callable[..., AsyncContextManager[AsyncSession]]]]
+        ] = None,
+        primary_used: Optional[Callable[[], bool]] = None,
+        principal_cache: Optional[AsyncCacheInterface] = None,
+        cache: Optional[AsyncCacheInterface] = None,
     ):
         super().__init__(
             view_model=sc.UserView,
             model=User,
             session_factory=session_factory,
+            read_session_factory=read_session_factory,
+            stream_session_factory=stream_session_factory,
+            get_batch_session_factory=get_batch_session_factory,
+            primary_used=primary_used,
         )
+        self.principal_cache = principal_cache
+        self.cache = cache
 
-    async def get_by_email(self, email: str) -> Optional[sc.UserUnprotectedView]:
-        stmt = select(User).where(User.email == email)
+    async def _invalidate_principals(
+        self,
+        session: AsyncSession,
+        emails: Iterable[str],
+    ) -> None:
+        emails = set(emails)
+        if self.principal_cache is not None and emails:
+            await run_after_commit(
+                session,
+                lambda: self.principal_cache.delete(*emails),
+            )
+
+    async def _update_users(
+        self,
+        criteria: List[ColumnElement],
+        values: dict,
+    ) -> List[sc.UserView]:
+        previous = (
+            select(User.id, User.email)
+            .where(*criteria)
+            .with_for_update()
+            .subquery("previous")
+        )
+        stmt = (
+            update(User)
+            .where(User.id == previous.c.id)
+            .values(**values)
+            .returning(
+                *self._get_returning(),
+                previous.c.email.label("previous_email"),
+            )
+            .execution_options(synchronize_session=False)
+        )
 
         async with self.session_factory() as session:
-            result = await session.scalars(stmt)
-            user = result.first()
-            if user:
-                return sc.UserUnprotectedView.parse_obj(user.__dict__)
+            result = await session.execute(stmt)
+            rows = result.all()
+            await self._commit(session)
+            await self._after_write(session, [row.id for row in rows])
+            await self._invalidate_principals(
+                session,
+                [email for row in rows for email in (row.email, row.previous_email)],
+            )
+
+        convert = self._get_converter(self.view_model)
+        return [convert(row) for row in rows]
+
+    def _get_conflict_target(
+        self,
+        table: Table,
+        conflict_fields: Optional[Sequence[str]] = None,
+    ) -> List[ColumnElement]:
+        if conflict_fields:
+            return super()._get_conflict_target(table, conflict_fields)
+        return [func.lower(table.c.email)]
+
+    def _get_by_email_statement(self) -> Select:
+        columns = self._get_projection(sc.UserUnprotectedView)
+        stmt = self._apply_options(self._get_select(columns), sc.UserUnprotectedView)
+        return stmt.where(
+            func.lower(User.email) == func.lower(bindparam("email", type_=String)),
+        )
+
+    def _get_by_emails_statement(self) -> Select:
+        columns = self._get_projection(sc.UserUnprotectedView)
+        stmt = self._apply_options(self._get_select(columns), sc.UserUnprotectedView)
+        keys = (
+            func.unnest(bindparam("emails", type_=ARRAY(String)))
+            .table_valued("email_key")
+            .render_derived("email_keys")
+        )
+        return stmt.add_columns(keys.c.email_key).join(
+            keys,
+            func.lower(User.email) == func.lower(keys.c.email_key),
+        )
+
+    async def _load_by_emails(
+        self,
+        session_factory: Callable[..., AsyncContextManager[AsyncSession]],
+        emails: List[str],
+    ) -> dict[str, sc.UserUnprotectedView]:
+        columns = self._get_projection(sc.UserUnprotectedView)
+        stmt = self._statements.get("emails", self._get_by_emails_statement)
+
+        async with session_factory() as session:
+            result = await session.execute(stmt, {"emails": emails})
+            return {
+                row.email_key: self._model_to_pydantic(
+                    row if columns else row[0],
+                    sc.UserUnprotectedView,
+                )
+                for row in result
+            }
+
+    async def get_by_email(self, email: str) -> Optional[sc.UserUnprotectedView]:
+        session_factory = self._get_batch_session_factory()
+        if session_factory is not None:
+            loader = self._get_loader("email", self._load_by_emails, session_factory)
+            return await loader.load(email)
+
+        stmt = self._statements.get("email", self._get_by_email_statement)
+
+        async with self.read_session_factory() as session:
+            result = await session.execute(stmt, {"email": email})
+            row = result.first()
+            if row:
+                return self._model_to_pydantic(row, sc.UserUnprotectedView)
             return None
+
+    async def update_password(
+        self,
+        id: int,
+        old_password: str,
+        new_password: str,
+    ) -> bool:
+        stmt = (
+            update(User)
+            .where(User.id == id, User.password == old_password)
+            .values(password=new_password)
+            .returning(User.email)
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            emails = result.scalars().all()
+            await self._commit(session)
+            await self._after_write(session, [id] if emails else [])
+            await self._invalidate_principals(session, emails)
+
+        return bool(emails)
+
+    async def upsert(
+        self,
+        obj_in: sc.UserCreate,
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+    ) -> Optional[sc.UserView]:
+        if conflict_fields:
+            criteria = [
+                getattr(User, name) == getattr(obj_in, name) for name in conflict_fields
+            ]
+        else:
+            criteria = [func.lower(User.email) == func.lower(obj_in.email)]
+        previous = select(User.email).where(*criteria).with_for_update()
+        stmt = self._get_upsert_statement(obj_in, conflict_fields, update_fields)
+
+        async with self.session_factory() as session:
+            emails = list((await session.execute(previous)).scalars())
+            result = await session.execute(stmt)
+            views = self._returning_to_pydantic(result)
+            await self._commit(session)
+            await self._after_write(session, [view.id for view in views])
+            await self._invalidate_principals(
+                session,
+                [*emails, *[view.email for view in views]],
+            )
+        return views[0] if views else None
+
+    async def update(
+        self,
+        obj_in: sc.UserUpdate,
+        filter_: sc.UserFilter,
+    ) -> Optional[sc.UserView]:
+        criteria = self._get_criteria(filter_)
+        values = self._model_values(obj_in)
+        if not criteria or not values:
+            return await super().update(obj_in, filter_)
+
+        views = await self._update_users(criteria, values)
+        return views[0] if views else None
+
+    async def update_many(
+        self,
+        obj_in: sc.UserUpdate,
+        filter_: Optional[sc.UserListFilter] = None,
+        ids: Optional[List[int]] = None,
+    ) -> List[sc.UserView]:
+        values = self._model_values(obj_in)
+        if not values:
+            return []
+        return await self._update_users(self._get_bulk_criteria(filter_, ids), values)
+
+    async def delete(self, filter_: sc.UserFilter) -> bool:
+        stmt = delete(User).where(User.id == filter_.id).returning(User.id, User.email)
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+            await self._commit(session)
+            await self._after_write(session, [row.id for row in rows])
+            await self._invalidate_principals(session, [row.email for row in rows])
+
+        return bool(rows)
+
+    async def delete_many(
+        self,
+        filter_: Optional[sc.UserListFilter] = None,
+        ids: Optional[List[int]] = None,
+    ) -> int:
+        stmt = (
+            delete(User)
+            .where(*self._get_bulk_criteria(filter_, ids))
+            .returning(User.id, User.email)
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+            await self._commit(session)
+            await self._after_write(session, [row.id for row in rows])
+            await self._invalidate_principals(session, [row.email for row in rows])
+
+        return len(rows)
+
+
+class RevokedTokenRepository(
+    RevokedTokenRepositoryInterface,
+    SqlAlchemyRepository[
+        RevokedToken,
+        sc.RevokedTokenView,
+        sc.RevokedTokenCreate,
+        sc.RevokedTokenCreate,
+        sc.RevokedTokenFilter,
+        sc.RevokedTokenListFilter,
+    ],
+):
+    unique_fields = ("jti",)
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AsyncContextManager[AsyncSession]],
+        revocation_list: Optional[RevocationList] = None,
+    ):
+        super().__init__(
+            view_model=sc.RevokedTokenView,
+            model=RevokedToken,
+            session_factory=session_factory,
+        )
+        self.revocation_list = revocation_list
+
+    async def get_active(
+        self,
+        since: Optional[datetime] = None,
+    ) -> List[sc.RevokedTokenView]:
+        columns = self._get_projection(self.view_model)
+        stmt = self._get_select(columns).where(
+            or_(
+                RevokedToken.expires_at.is_(None), RevokedToken.expires_at > func.now()
+            ),
+        )
+        if since is not None:
+            stmt = stmt.where(RevokedToken.created_at >= since)
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            convert = self._get_converter(self.view_model)
+            return [convert(row) for row in result.all()]
+
+    async def revoke(self, obj_in: sc.RevokedTokenCreate) -> bool:
+        stmt = (
+            pg_insert(RevokedToken)
+            .values(**self._model_values(obj_in))
+            .on_conflict_do_nothing(
+                index_elements=self._get_conflict_target(RevokedToken.__table__),
+            )
+            .returning(RevokedToken.jti)
+        )
+
+        async def add_revoked() -> None:
+            self.revocation_list.add(obj_in.jti, obj_in.expires_at)
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            created = result.scalar() is not None
+            await self._commit(session)
+            if self.revocation_list is not None:
+                await run_after_commit(session, add_revoked)
+
+        return created
+
+    async def delete_expired(self) -> int:
+        stmt = (
+            delete(RevokedToken)
+            .where(RevokedToken.expires_at <= func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            await self._commit(session)
+            return result.rowcount
@@ -0,0 +1,26 @@
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+
+class RevocationList:
+    def __init__(self) -> None:
+        self._revoked: dict[str, Optional[float]] = {}
+        self.synced_at: Optional[datetime] = None
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        return jti is not None and jti in self._revoked
+
+    def add(self, jti: str, expires_at: Optional[datetime]) -> None:
+        self._revoked[jti] = expires_at.timestamp() if expires_at else None
+
+    def compact(self) -> None:
+        now = time.time()
+        self._revoked = {
+            jti: expires_at
+            for jti, expires_at in self._revoked.items()
+            if expires_at is None or expires_at > now
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {"size": len(self._revoked), "synced_at": self.synced_at}
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 import pydantic as pd
@@ -26,6 +27,33 @@ class UserUpdate(BaseUser):
     password: Optional[str] = pd.Field(min_length=6)
 
 
+class UserBulkCreate(pd.BaseModel):
+    data: list[UserCreate] = pd.Field(min_length=1, max_length=1000)
+
+
+class UserBulkUpdate(pd.BaseModel):
+    ids: list[int] = pd.Field(min_length=1, max_length=1000)
+    data: UserUpdate
+
+
+class UserImport(UserCreate):
+    first_name: str
+    middle_name: str
+    last_name: str
+
+
+class UserImportError(pd.BaseModel):
+    row: int
+    field: Optional[str] = None
+    message: str
+
+
+class UserImportReport(pd.BaseModel):
+    total: int = 0
+    created: int = 0
+    errors: list[UserImportError] = []
+
+
 class UserUnprotectedView(UserView):
     password: str
 
@@ -35,6 +63,33 @@ class UserFilter(Filter):
 
 
 class UserListFilter(ListFilter):
+    ordering = ("created_at", "id")
+    orderable = ("id", "email", "first_name", "last_name", "created_at")
+
+    id__in: Optional[str] = None
+    email__iexact: Optional[str] = Field(None, alias="email")
+    email__ilike: Optional[str] = None
+    first_name__icontains: Optional[str] = None
+    last_name__icontains: Optional[str] = None
+    created_at__gte: Optional[datetime] = None
+    created_at__lt: Optional[datetime] = None
+
+
+class RevokedTokenView(PrimaryKeyMixin):
+    jti: str
+    expires_at: Optional[datetime] = None
+
+
+class RevokedTokenCreate(pd.BaseModel):
+    jti: str
+    expires_at: Optional[datetime] = None
+
+
+class RevokedTokenFilter(Filter):
+    ...
+
+
+class RevokedTokenListFilter(ListFilter):
     ...
 
 
@@ -57,3 +112,7 @@ class RefreshTokenResponse(BaseRefreshToken):
 
 class TokensResponse(BaseTokenResponse, BaseRefreshToken):
     ...
+
+
+class LogoutRequest(pd.BaseModel):
+    refresh_token: Optional[str] = None
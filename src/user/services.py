@@ -1,24 +1,186 @@
-from typing import Optional
+import asyncio
+import os
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    ContextManager,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
-from passlib.context import CryptContext
+import pydantic as pd
 
 from src.common.mixins.services import ServiceRepositoryMixin
 from src.user import schemas as sc
-from src.user.exceptions import UserEmailExistsError
-from src.user.interfaces import UserRepositoryInterface
-
-password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.user.exceptions import (
+    PasswordHasherOverloadedError,
+    UserEmailExistsError,
+    UserImportTooLargeError,
+)
+from src.user.hashing import PasswordHasher, create_process_pool
+from src.user.interfaces import RevokedTokenRepositoryInterface, UserRepositoryInterface
+from src.user.revocation import RevocationList
+from src.utils.imports import ImportRow
+from src.utils.tasks import spawn_detached
 
 
 class UserService(ServiceRepositoryMixin[UserRepositoryInterface, sc.UserView]):
+    export_fields = {
+        "id": "id",
+        "email": "email",
+        "first_name": "first_name",
+        "middle_name": "middle_name",
+        "last_name": "last_name",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    }
+
+    def __init__(
+        self,
+        repository: UserRepositoryInterface,
+        password_hasher: PasswordHasher,
+        import_batch_size: int = 5000,
+        import_processes: Optional[int] = None,
+        import_executor: Optional[Executor] = None,
+    ):
+        super().__init__(repository)
+        self.password_hasher = password_hasher
+        self.import_batch_size = import_batch_size
+        self.import_processes = import_processes or os.cpu_count() or 1
+        self.import_executor = import_executor
+
     async def repository_create_object(  # type: ignore
         self,
         obj_in: sc.UserCreate,
     ) -> Optional[sc.UserView]:
-        obj_in.password = self.get_password_hash(obj_in.password)
-        if await self.repository.get_by_email(obj_in.email):
+        obj_in.password = await self.get_password_hash(obj_in.password)
+        user = await self.repository.create_or_ignore(obj_in)
+        if user is None:
             raise UserEmailExistsError(obj_in.email)
-        return await super().repository_create_object(obj_in)
+        return user
+
+    async def repository_create_objects(  # type: ignore
+        self,
+        objs_in: List[sc.UserCreate],
+    ) -> List[sc.UserView]:
+        hashes = await self.password_hasher.hash_many(
+            [obj_in.password for obj_in in objs_in],
+        )
+        for obj_in, password in zip(objs_in, hashes):
+            obj_in.password = password
+        return await super().repository_create_objects(objs_in)
+
+    async def import_objects(
+        self,
+        rows: Iterable[ImportRow],
+    ) -> AsyncIterator[sc.UserImportReport]:
+        numbered = enumerate(rows, start=1)
+        with self._import_executor() as executor:
+            while batch := await asyncio.to_thread(self._read_batch, numbered):
+                yield await self._import_batch(batch, executor)
+
+    async def import_batch(self, rows: Iterable[ImportRow]) -> sc.UserImportReport:
+        numbered = enumerate(rows, start=1)
+        batch = await asyncio.to_thread(self._read_batch, numbered)
+        if await asyncio.to_thread(next, numbered, None) is not None:
+            raise UserImportTooLargeError(self.import_batch_size)
+        if batch is None:
+            return sc.UserImportReport()
+
+        with self._import_executor() as executor:
+            return await self._import_batch(batch, executor)
+
+    def _import_executor(self) -> ContextManager[Executor]:
+        if self.import_executor is not None:
+            return nullcontext(self.import_executor)
+        return create_process_pool(self.import_processes)
+
+    def _read_batch(
+        self,
+        numbered: Iterator[Tuple[int, ImportRow]],
+    ) -> Optional[Tuple[sc.UserImportReport, List[int], List[sc.UserImport]]]:
+        batch = list(islice(numbered, self.import_batch_size))
+        if not batch:
+            return None
+
+        report = sc.UserImportReport(total=len(batch))
+        numbers, objs_in = [], []
+        for number, row in batch:
+            try:
+                if isinstance(row, str):
+                    obj_in = sc.UserImport.model_validate_json(row)
+                else:
+                    obj_in = sc.UserImport.model_validate(row)
+            except pd.ValidationError as ex:
+                report.errors.extend(
+                    sc.UserImportError(
+                        row=number,
+                        field=".".join(map(str, error["loc"])) or None,
+                        message=error["msg"],
+                    )
+                    for error in ex.errors()
+                )
+                continue
+            numbers.append(number)
+            objs_in.append(obj_in)
+        return report, numbers, objs_in
+
+    async def _import_batch(
+        self,
+        batch: Tuple[sc.UserImportReport, List[int], List[sc.UserImport]],
+        executor: Executor,
+    ) -> sc.UserImportReport:
+        report, numbers, objs_in = batch
+        hashes = await self.password_hasher.hash_batch(
+            [obj_in.password for obj_in in objs_in],
+            executor,
+            self.import_processes,
+        )
+        for obj_in, password in zip(objs_in, hashes):
+            obj_in.password = password
+
+        ids = await self.repository.import_many(objs_in)
+        for number, id_ in zip(numbers, ids):
+            if id_ is None:
+                report.errors.append(
+                    sc.UserImportError(
+                        row=number,
+                        field="email",
+                        message="Email already exists",
+                    ),
+                )
+        report.created = len(ids) - ids.count(None)
+        report.errors.sort(key=lambda error: error.row)
+        return report
+
+    async def repository_update_object(  # type: ignore
+        self,
+        filter_: sc.UserFilter,
+        obj_in: sc.UserUpdate,
+    ) -> Optional[sc.UserView]:
+        if obj_in.password is not None:
+            obj_in.password = await self.get_password_hash(obj_in.password)
+        return await super().repository_update_object(filter_, obj_in)
+
+    async def repository_update_objects(  # type: ignore
+        self,
+        obj_in: sc.UserUpdate,
+        filter_: Optional[sc.UserListFilter] = None,
+        ids: Optional[List[int]] = None,
+    ) -> List[sc.UserView]:
+        if obj_in.password is not None:
+            obj_in.password = await self.get_password_hash(obj_in.password)
+        return await super().repository_update_objects(obj_in, filter_, ids)
+
+    async def repository_object_by_email(self, email: str) -> Optional[sc.UserView]:
+        return await self.repository.get_by_email(email)
 
     async def authenticate_user(
         self,
@@ -26,14 +188,72 @@ class UserService(ServiceRepositoryMixin[UserRepositoryInterface, sc.UserView]):
         password: str,
     ) -> Optional[sc.UserUnprotectedView]:
         user = await self.repository.get_by_email(email)
-        if user and self.password_verify(password, user.password):
-            return user
-        return None
+        if user is None or not await self.password_verify(password, user.password):
+            return None
+
+        if self.password_hasher.needs_update(user.password):
+            spawn_detached(self.rehash_password(user, password))
+        return user
+
+    async def rehash_password(
+        self,
+        user: sc.UserUnprotectedView,
+        password: str,
+    ) -> bool:
+        try:
+            hashed_password = await self.get_password_hash(password)
+        except PasswordHasherOverloadedError:
+            return False
+        return await self.repository.update_password(
+            user.id,
+            user.password,
+            hashed_password,
+        )
+
+    async def get_password_hash(self, plain_password: str) -> str:
+        return await self.password_hasher.hash(plain_password)
+
+    async def password_verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.password_hasher.verify(plain_password, hashed_password)
+
+
+class TokenService(
+    ServiceRepositoryMixin[RevokedTokenRepositoryInterface, sc.RevokedTokenView],
+):
+    sync_overlap = timedelta(seconds=60)
+
+    def __init__(
+        self,
+        repository: RevokedTokenRepositoryInterface,
+        revocation_list: RevocationList,
+    ):
+        super().__init__(repository)
+        self.revocation_list = revocation_list
+
+    async def revoke(self, payload: dict[str, Any]) -> bool:
+        jti = payload.get("jti")
+        if jti is None:
+            return False
+
+        expires_at = None
+        if "exp" in payload:
+            expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+
+        return await self.repository.revoke(
+            sc.RevokedTokenCreate(jti=jti, expires_at=expires_at),
+        )
+
+    async def sync(self) -> None:
+        since = None
+        if self.revocation_list.synced_at is not None:
+            since = self.revocation_list.synced_at - self.sync_overlap
 
-    @staticmethod
-    def get_password_hash(plain_password: str) -> str:
-        return password_context.hash(plain_password)
+        synced_at = datetime.now(timezone.utc)
+        for token in await self.repository.get_active(since):
+            self.revocation_list.add(token.jti, token.expires_at)
+        self.revocation_list.synced_at = synced_at
 
-    @staticmethod
-    def password_verify(plain_password: str, hashed_password: str) -> bool:
-        return password_context.verify(plain_password, hashed_password)
+    async def compact(self) -> int:
+        deleted = await self.repository.delete_expired()
+        self.revocation_list.compact()
+        return deleted
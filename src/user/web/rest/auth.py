@@ -8,11 +8,13 @@ from fastapi.security import (
     OAuth2PasswordRequestForm,
 )
 
+from src.common.exceptions.http import HTTPServiceUnavailableException
+from src.common.interfaces.cache import AsyncCacheInterface
 from src.user import schemas as sc
-from src.user.auth import Auth
-from src.user.exceptions import UserEmailExistsError
-from src.user.schemas import AccessTokenResponse, TokensResponse
-from src.user.services import UserService
+from src.user.auth import Auth, token_scheme
+from src.user.exceptions import PasswordHasherOverloadedError, UserEmailExistsError
+from src.user.schemas import TokensResponse
+from src.user.services import TokenService, UserService
 
 router = APIRouter(tags=["Авторизация"])
 
@@ -35,6 +37,8 @@ async def sign_up(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Email {ex.email} is exists",
         ) from ex
+    except PasswordHasherOverloadedError as ex:
+        raise HTTPServiceUnavailableException from ex
 
 
 @router.post(
@@ -48,26 +52,55 @@ async def sign_in(
     credentials: OAuth2PasswordRequestForm = Depends(),
     user_service: UserService = Depends(Provide["services.user_service"]),
 ) -> sc.TokensResponse:
-    user = await user_service.authenticate_user(
-        email=credentials.username,
-        password=credentials.password,
-    )
+    try:
+        user = await user_service.authenticate_user(
+            email=credentials.username,
+            password=credentials.password,
+        )
+    except PasswordHasherOverloadedError as ex:
+        raise HTTPServiceUnavailableException from ex
 
     if not user:
         raise HTTPException(status_code=401, detail="Incorrect email or password")
 
-    access_token = Auth.create_access_token({"sub": user.email})
+    access_token = Auth.create_access_token(Auth.principal_claims(user))
     refresh_token = Auth.create_refresh_token({"sub": user.email})
     return TokensResponse(access_token=access_token, refresh_token=refresh_token)
 
 
 @router.post("/refresh")
 @inject
-def refresh(
+async def refresh(
     credentials: HTTPAuthorizationCredentials = Security(HTTPBearer()),
-) -> sc.AccessTokenResponse:
-    ref_token = Auth.check_refresh_token(credentials.credentials)
-    if ref_token:
-        access_token = Auth.create_access_token({"sub": ref_token})
-        return AccessTokenResponse(access_token=access_token)
-    raise HTTPException(status_code=401, detail="Incorrect token")
+    user_service: UserService = Depends(Provide["services.user_service"]),
+    token_service: TokenService = Depends(Provide["services.token_service"]),
+) -> sc.TokensResponse:
+    payload = Auth.decode_refresh_token(credentials.credentials)
+    if not await token_service.revoke(payload):
+        raise HTTPException(status_code=401, detail="Incorrect token")
+
+    user = await user_service.repository_object_by_email(payload["sub"])
+    if user is None:
+        raise HTTPException(status_code=401, detail="Incorrect token")
+
+    access_token = Auth.create_access_token(Auth.principal_claims(user))
+    refresh_token = Auth.create_refresh_token({"sub": user.email})
+    return TokensResponse(access_token=access_token, refresh_token=refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+@inject
+async def logout(
+    obj_in: Optional[sc.LogoutRequest] = None,
+    token: str = Depends(token_scheme),
+    token_cache: AsyncCacheInterface = Depends(Provide["token_cache"]),
+    token_service: TokenService = Depends(Provide["services.token_service"]),
+) -> None:
+    payload = await Auth.decode_access_token(token, token_cache)
+    await token_service.revoke(payload)
+
+    if obj_in and obj_in.refresh_token:
+        refresh_payload = Auth.decode_refresh_token(obj_in.refresh_token)
+        if refresh_payload["sub"] != payload.get("sub"):
+            raise HTTPException(status_code=401, detail="Incorrect token")
+        await token_service.revoke(refresh_payload)
@@ -1,37 +1,167 @@
-from typing import Optional
+import codecs
+from typing import List, Optional
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 
-from src.common.exceptions.http import HTTPNotFoundException
-from src.common.schemas.response import ResponseList
+from src.common.exceptions.filters import FilterError
+from src.common.exceptions.http import (
+    HTTPNotFoundException,
+    HTTPServiceUnavailableException,
+)
+from src.common.exceptions.repository import DuplicateRowsError
+from src.common.schemas.response import ResponseBulk, ResponseDeleted, ResponseList
+from src.common.web.responses import ModelResponse
 from src.user import schemas as sc
 from src.user.auth import Auth
+from src.user.exceptions import PasswordHasherOverloadedError, UserImportTooLargeError
 from src.user.services import UserService
+from src.utils.export import MEDIA_TYPES, ExportFormat
+from src.utils.imports import READERS
 
 router = APIRouter()
 
+UserListResponse = ResponseList[sc.UserView]
+UserBulkResponse = ResponseBulk[sc.UserView]
+
 
-@router.get("/", tags=["Пользователи"])
+@router.get("/", tags=["Пользователи"], response_model=UserListResponse)
 @inject
 async def user_list(
     _: Auth = Depends(Auth()),
     filter_: sc.UserListFilter = Depends(),
     user_service: UserService = Depends(Provide["services.user_service"]),
-) -> ResponseList[sc.UserView]:
-    data = await user_service.repository_objects(filter_)
-    return ResponseList[sc.UserView](
-        data=data,
-        meta=filter_.meta,
+) -> ModelResponse:
+    try:
+        data = await user_service.repository_objects(filter_)
+    except FilterError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(ex),
+        ) from ex
+    return ModelResponse(
+        UserListResponse.from_trusted(data, filter_.meta),
+        exclude_unset=True,
+    )
+
+
+@router.get("/export", tags=["Пользователи"])
+@inject
+async def user_export(
+    format_: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    _: Auth = Depends(Auth()),
+    filter_: sc.UserListFilter = Depends(),
+    user_service: UserService = Depends(Provide["services.user_service"]),
+) -> StreamingResponse:
+    try:
+        chunks = await user_service.repository_export(filter_, format_)
+    except FilterError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(ex),
+        ) from ex
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format_],
+        headers={
+            "Content-Disposition": f'attachment; filename="users.{format_.value}"',
+        },
+    )
+
+
+@router.post(
+    "/bulk",
+    tags=["Пользователи"],
+    status_code=status.HTTP_201_CREATED,
+    response_model=UserBulkResponse,
+)
+@inject
+async def user_bulk_create(
+    obj_in: sc.UserBulkCreate,
+    _: Auth = Depends(Auth()),
+    user_service: UserService = Depends(Provide["services.user_service"]),
+) -> ModelResponse:
+    try:
+        data = await user_service.repository_create_objects(obj_in.data)
+    except DuplicateRowsError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=ex.rows,
+        ) from ex
+    except PasswordHasherOverloadedError as ex:
+        raise HTTPServiceUnavailableException from ex
+    return ModelResponse(
+        UserBulkResponse.from_trusted(data),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.put(
+    "/bulk",
+    tags=["Пользователи"],
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=UserBulkResponse,
+)
+@inject
+async def user_bulk_update(
+    obj_in: sc.UserBulkUpdate,
+    _: Auth = Depends(Auth()),
+    user_service: UserService = Depends(Provide["services.user_service"]),
+) -> ModelResponse:
+    try:
+        data = await user_service.repository_update_objects(
+            obj_in.data,
+            ids=obj_in.ids,
+        )
+    except PasswordHasherOverloadedError as ex:
+        raise HTTPServiceUnavailableException from ex
+    return ModelResponse(
+        UserBulkResponse.from_trusted(data),
+        status_code=status.HTTP_202_ACCEPTED,
     )
 
 
+@router.delete(
+    "/bulk",
+    tags=["Пользователи"],
+)
+@inject
+async def user_bulk_delete(
+    ids: List[int] = Query([], max_length=1000),
+    _: Auth = Depends(Auth()),
+    user_service: UserService = Depends(Provide["services.user_service"]),
+) -> ResponseDeleted:
+    deleted = await user_service.repository_delete_objects(ids=ids)
+    return ResponseDeleted(deleted=deleted)
+
+
+@router.post("/import", tags=["Пользователи"])
+@inject
+async def user_import(
+    file: UploadFile,
+    format_: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    _: Auth = Depends(Auth()),
+    user_service: UserService = Depends(Provide["services.user_service"]),
+) -> sc.UserImportReport:
+    rows = READERS[format_](codecs.iterdecode(file.file, "utf-8-sig"))
+    try:
+        return await user_service.import_batch(rows)
+    except UserImportTooLargeError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {ex.max_rows} rows per upload, "
+            "use python -m src.import_users for larger files",
+        ) from ex
+
+
 @router.get(
     "/{id}",
     responses={
         status.HTTP_404_NOT_FOUND: {"description": "Not Found"},
     },
     tags=["Пользователи"],
+    response_model_exclude_unset=True,
 )
 @inject
 async def user(
@@ -39,7 +169,13 @@ async def user(
     filter_: sc.UserFilter = Depends(),
     user_service: UserService = Depends(Provide["services.user_service"]),
 ) -> sc.UserView:
-    model = await user_service.repository_object(filter_)
+    try:
+        model = await user_service.repository_object(filter_)
+    except FilterError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(ex),
+        ) from ex
     if not model:
         raise HTTPNotFoundException
     return model
@@ -59,7 +195,10 @@ async def user_update(
 ) -> Optional[sc.UserView]:
     filter_ = sc.UserFilter(id=id)
 
-    result = await user_service.repository_update_object(filter_, obj_in)
+    try:
+        result = await user_service.repository_update_object(filter_, obj_in)
+    except PasswordHasherOverloadedError as ex:
+        raise HTTPServiceUnavailableException from ex
     if result:
         return result
     raise HTTPNotFoundException
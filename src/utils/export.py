@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, AsyncIterable, AsyncIterator, Callable
+
+ExportRows = AsyncIterable[dict[str, Any]]
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+async def write_csv(
+    rows: ExportRows,
+    columns: dict[str, str],
+    chunk_size: int = 1000,
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns.values())
+
+    count = 0
+    async for row in rows:
+        writer.writerow([row.get(field) for field in columns])
+        count += 1
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def write_ndjson(
+    rows: ExportRows,
+    columns: dict[str, str],
+    chunk_size: int = 1000,
+) -> AsyncIterator[str]:
+    lines = []
+    async for row in rows:
+        lines.append(
+            json.dumps({name: row.get(field) for field, name in columns.items()}),
+        )
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+WRITERS: dict[ExportFormat, Callable[..., AsyncIterator[str]]] = {
+    ExportFormat.CSV: write_csv,
+    ExportFormat.NDJSON: write_ndjson,
+}
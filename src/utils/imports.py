@@ -0,0 +1,27 @@
+import csv
+from typing import Any, Callable, Iterable, Iterator
+
+from src.utils.export import ExportFormat
+
+ImportRow = str | dict[str, Any]
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[ImportRow]:
+    for row in csv.DictReader(lines):
+        yield {
+            key: value
+            for key, value in row.items()
+            if key is not None and value is not None
+        }
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[ImportRow]:
+    for line in lines:
+        if line.strip():
+            yield line
+
+
+READERS: dict[ExportFormat, Callable[[Iterable[str]], Iterator[ImportRow]]] = {
+    ExportFormat.CSV: read_csv,
+    ExportFormat.NDJSON: read_ndjson,
+}
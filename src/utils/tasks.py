@@ -0,0 +1,12 @@
+import asyncio
+import contextvars
+from typing import Any, Coroutine
+
+_background_tasks: set[asyncio.Task] = set()
+
+
+def spawn_detached(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    task = contextvars.Context().run(asyncio.create_task, coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
@@ -0,0 +1,68 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.database import BaseModel
+from src.settings import setting
+from src.user import schemas as sc
+from src.user.private.repositories import UserRepository
+
+
+@pytest.fixture()
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture()
+async def connection(anyio_backend: str) -> AsyncIterator[AsyncConnection]:
+    engine = create_async_engine(setting.DB_DSN, poolclass=NullPool)
+    try:
+        conn = await engine.connect()
+    except (OSError, exc.DBAPIError) as ex:
+        await engine.dispose()
+        pytest.skip(f"database is not available: {ex}")
+
+    transaction = await conn.begin()
+    try:
+        await conn.run_sync(BaseModel.metadata.create_all)
+        yield conn
+    finally:
+        await transaction.rollback()
+        await conn.close()
+        await engine.dispose()
+
+
+@pytest.fixture()
+def session_factory(connection: AsyncConnection) -> Callable:
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+
+    return factory
+
+
+@pytest.fixture()
+async def user_repository(session_factory: Callable) -> UserRepository:
+    repository = UserRepository(session_factory)
+    await repository.create_many(
+        [
+            sc.UserCreate(
+                email=f"user{idx}@example.com",
+                first_name=f"first{idx}",
+                middle_name="middle",
+                last_name="last",
+                password="password",
+            )
+            for idx in range(30)
+        ],
+    )
+    return repository
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from typing import Callable
+
+import pytest
+
+from src.common.exceptions.explain import SequentialScanError
+from src.common.repositories.sqlalchemy.advisor import IndexAdvisor
+from src.common.schemas.filters.cursor import encode_cursor
+from src.user import schemas as sc
+from src.user.private.repositories import UserRepository
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_user_queries_use_indexes(
+    session_factory: Callable,
+    user_repository: UserRepository,
+) -> None:
+    advisor = IndexAdvisor(session_factory, row_threshold=0)
+    cursor = encode_cursor([datetime.now(timezone.utc), 1])
+
+    await advisor.check_repository(
+        user_repository,
+        [
+            sc.UserFilter(id=1),
+            sc.UserListFilter(),
+            sc.UserListFilter(email="user1@example.com"),
+            sc.UserListFilter(after=cursor),
+        ],
+    )
+
+
+async def test_unindexed_filter_is_reported(
+    session_factory: Callable,
+    user_repository: UserRepository,
+) -> None:
+    advisor = IndexAdvisor(session_factory, row_threshold=0)
+
+    with pytest.raises(SequentialScanError) as ex:
+        await advisor.check_repository(
+            user_repository,
+            [sc.UserListFilter(first_name__icontains="first1")],
+        )
+    assert {scan["relation"] for scan in ex.value.scans} == {"users"}
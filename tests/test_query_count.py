@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.common.repositories.sqlalchemy.counter import QueryCounter
+from src.common.schemas.filters import CountStrategy
+from src.user import schemas as sc
+from src.user.private.repositories import UserRepository
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_get_runs_one_statement(
+    connection: AsyncConnection,
+    user_repository: UserRepository,
+) -> None:
+    with QueryCounter(connection.engine, limit=1) as counter:
+        user = await user_repository.get(sc.UserFilter(id=1))
+
+    assert user is not None
+    assert counter.count == 1
+
+
+@pytest.mark.parametrize("limit", [1, 10, 30])
+@pytest.mark.parametrize("count", [CountStrategy.EXACT, CountStrategy.NONE])
+async def test_list_statement_count_does_not_grow_with_page_size(
+    connection: AsyncConnection,
+    user_repository: UserRepository,
+    limit: int,
+    count: CountStrategy,
+) -> None:
+    filter_ = sc.UserListFilter(limit=limit, count=count)
+
+    with QueryCounter(connection.engine, limit=1, max_repeats=1) as counter:
+        users = await user_repository.get_list(filter_)
+
+    assert len(users) == limit
+    assert counter.count == 1